@@ -4,51 +4,82 @@ Crius Ephemeris Core - Pure ephemeris types and interfaces.
 Named after Crius, the Titan of constellations and measuring the year.
 """
 
+from typing import Any
+
 from .types import (
     EphemerisSettings,
     GeoLocation,
     PlanetPosition,
+    HouseAngles,
     HousePositions,
     LayerPositions,
     LayerContext,
     VedicOptions,
+    ZodiacType,
+    DashaDepth,
+    PlanetPositionSeries,
+    LayerPositionsBatch,
+    freeze_layer_positions,
+    normalize_settings,
 )
 
-from .protocols import EphemerisAdapter
-
-# Optional service imports (can be imported separately)
-try:
-    from .service import (
-        EphemerisService,
-        BaseEphemerisService,
-        CachedEphemerisService,
-        CacheProvider,
-        create_ephemeris_service,
-    )
-    _SERVICE_AVAILABLE = True
-except ImportError:
-    _SERVICE_AVAILABLE = False
-
-__all__ = [
+from .protocols import EphemerisAdapter, BatchEphemerisAdapter, ParallelEphemerisAdapter
+
+# Service exports are imported lazily on first access (PEP 562), so importing
+# the package for its types does not load the service layer
+_SERVICE_EXPORTS = frozenset({
+    "EphemerisService",
+    "BaseEphemerisService",
+    "CachedEphemerisService",
+    "MemoizedEphemerisService",
+    "CacheProvider",
+    "LRUCacheProvider",
+    "TieredCacheProvider",
+    "create_ephemeris_service",
+})
+
+__all__ = (
     "EphemerisSettings",
     "GeoLocation",
     "PlanetPosition",
+    "HouseAngles",
     "HousePositions",
     "LayerPositions",
     "LayerContext",
     "EphemerisAdapter",
+    "BatchEphemerisAdapter",
+    "ParallelEphemerisAdapter",
     "VedicOptions",
-]
-
-# Add service exports if available
-if _SERVICE_AVAILABLE:
-    __all__.extend([
-        "EphemerisService",
-        "BaseEphemerisService",
-        "CachedEphemerisService",
-        "CacheProvider",
-        "create_ephemeris_service",
-    ])
+    "ZodiacType",
+    "DashaDepth",
+    "PlanetPositionSeries",
+    "LayerPositionsBatch",
+    "freeze_layer_positions",
+    "normalize_settings",
+    "EphemerisService",
+    "BaseEphemerisService",
+    "CachedEphemerisService",
+    "MemoizedEphemerisService",
+    "CacheProvider",
+    "LRUCacheProvider",
+    "TieredCacheProvider",
+    "create_ephemeris_service",
+)
 
 __version__ = "0.1.0"
 
+
+def __getattr__(name: str) -> Any:
+    """Import service exports on first access."""
+    if name in _SERVICE_EXPORTS:
+        from . import service
+
+        value = getattr(service, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported service exports."""
+    return sorted(set(globals()) | _SERVICE_EXPORTS)
@@ -0,0 +1,39 @@
+"""
+Lazy re-export of the Pydantic models from ``validation``.
+
+``validation`` imports this module's __getattr__ as its own module
+__getattr__, so ``validation.EphemerisSettingsModel`` and
+``from crius_ephemeris_core.validation import EphemerisSettingsModel`` import
+the Pydantic backend on first access. It lives in a separate module because
+mypyc cannot compile a module-level __getattr__, and this module is never
+compiled, even when ``validation`` is built with CRIUS_USE_MYPYC=1.
+"""
+
+from typing import Any
+
+_PYDANTIC_MODELS = frozenset({
+    "VedicOptionsModel",
+    "EphemerisSettingsModel",
+    "GeoLocationModel",
+    "PlanetPositionModel",
+    "HousePositionsModel",
+    "LayerPositionsModel",
+    "LayerContextModel",
+})
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Pydantic models on first access."""
+    if name in _PYDANTIC_MODELS:
+        from .validation import _pydantic_backend
+
+        try:
+            backend = _pydantic_backend()
+        except ImportError as exc:
+            # AttributeError keeps hasattr() and getattr(..., default) working
+            raise AttributeError(
+                f"module 'crius_ephemeris_core.validation' has no attribute {name!r}"
+                " (Pydantic is not installed)"
+            ) from exc
+        return getattr(backend, name)
+    raise AttributeError(f"module 'crius_ephemeris_core.validation' has no attribute {name!r}")
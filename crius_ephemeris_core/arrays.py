@@ -0,0 +1,253 @@
+"""
+NumPy array representations of ephemeris positions (optional dependency).
+
+This module provides a structured-array layout for LayerPositions, so that
+all planets of a chart live in one contiguous NumPy array instead of one dict
+per planet, and a column layout with one contiguous array per planet field
+for vectorized computations over a single field. NumPy is an optional
+dependency - if not installed, conversion functions will raise ImportError.
+
+To use array representations, install numpy:
+    pip install numpy
+
+Or install with array support:
+    pip install crius-ephemeris-core[arrays]
+"""
+
+from math import isnan
+from typing import Any, Optional, TypedDict, cast
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
+from .types import HouseAngles, HousePositions, LayerPositions
+
+
+def _check_numpy() -> None:
+    """Check if NumPy is available, raise ImportError if not."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "NumPy is required for array representations. Install it with: "
+            "pip install numpy"
+            " or pip install crius-ephemeris-core[arrays]"
+        )
+
+
+if NUMPY_AVAILABLE:
+    PLANET_DTYPE = np.dtype(
+        [
+            ("lon", "f8"),  # Longitude in degrees (0-360)
+            ("lat", "f8"),  # Latitude in degrees
+            ("speed_lon", "f8"),  # Speed in longitude (degrees per day)
+            ("retrograde", "?"),  # Whether the planet is retrograde
+        ]
+    )
+    PlanetPositionArray = np.ndarray
+else:
+    PLANET_DTYPE = None  # type: ignore
+    PlanetPositionArray = Any  # type: ignore
+
+
+# House number ("1".."12") -> index into HousePositionsArray cusps
+CUSP_INDEX = {str(i + 1): i for i in range(12)}
+# Angle name -> index into HousePositionsArray angles
+ANGLE_INDEX = {"asc": 0, "mc": 1, "ic": 2, "dc": 3}
+
+
+class HousePositionsArray(TypedDict):
+    """House system positions with cusps and angles as fixed-length arrays."""
+
+    system: str  # House system name
+    cusps: Any  # Shape (12,), dtype f8, index CUSP_INDEX; NaN where missing
+    angles: Any  # Shape (4,), dtype f8, order asc, mc, ic, dc; NaN where missing
+
+
+class LayerPositionsArray(TypedDict):
+    """Complete position data for a chart layer, with planets as a structured array."""
+
+    planet_ids: tuple[str, ...]  # Planet IDs, in array row order
+    planets: PlanetPositionArray  # Shape (n_planets,), dtype PLANET_DTYPE
+    houses: Optional[HousePositionsArray]  # House positions (None if no location provided)
+
+
+class LayerPositionsSoA(TypedDict):
+    """Complete position data for a chart layer, with one contiguous array per planet field."""
+
+    planet_ids: tuple[str, ...]  # Planet IDs, in array order
+    lon: Any  # Shape (n_planets,), dtype f8; longitudes in degrees (0-360)
+    lat: Any  # Shape (n_planets,), dtype f8; latitudes in degrees
+    speed_lon: Any  # Shape (n_planets,), dtype f8; speeds in longitude (degrees per day)
+    retrograde: Any  # Shape (n_planets,), dtype bool; retrograde mask
+    houses: Optional[HousePositionsArray]  # House positions (None if no location provided)
+
+
+def houses_from_dict(houses: HousePositions) -> HousePositionsArray:
+    """
+    Convert HousePositions to a HousePositionsArray.
+
+    Cusps and angles missing from the dict are stored as NaN. Keys outside
+    CUSP_INDEX / ANGLE_INDEX are ignored.
+
+    Args:
+        houses: HousePositions dict
+
+    Returns:
+        HousePositionsArray with cusps of shape (12,) and angles of shape (4,)
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    _check_numpy()
+    cusps = np.full(12, np.nan)
+    for house, value in houses["cusps"].items():
+        index = CUSP_INDEX.get(house)
+        if index is not None:
+            cusps[index] = value
+    angles = np.full(4, np.nan)
+    # HouseAngles is total=False, so mypy types its values as object
+    for angle, value in cast(dict[str, float], houses["angles"]).items():
+        index = ANGLE_INDEX.get(angle)
+        if index is not None:
+            angles[index] = value
+    return {"system": houses["system"], "cusps": cusps, "angles": angles}
+
+
+def houses_to_dict(houses: HousePositionsArray) -> HousePositions:
+    """
+    Convert a HousePositionsArray back to HousePositions.
+
+    NaN entries are left out of the resulting dicts.
+
+    Args:
+        houses: HousePositionsArray
+
+    Returns:
+        HousePositions dict with plain Python floats
+    """
+    cusps = houses["cusps"].tolist()
+    angles = houses["angles"].tolist()
+    return {
+        "system": houses["system"],
+        "cusps": {house: cusps[i] for house, i in CUSP_INDEX.items() if not isnan(cusps[i])},
+        "angles": cast(HouseAngles, {
+            angle: angles[i] for angle, i in ANGLE_INDEX.items() if not isnan(angles[i])
+        }),
+    }
+
+
+def from_dict(positions: LayerPositions) -> LayerPositionsArray:
+    """
+    Convert LayerPositions to a LayerPositionsArray.
+
+    Args:
+        positions: LayerPositions dict
+
+    Returns:
+        LayerPositionsArray with one PLANET_DTYPE row per planet and houses
+        as a HousePositionsArray
+
+    Raises:
+        ImportError: If NumPy is not installed
+
+    Example:
+        >>> arr = from_dict(positions)
+        >>> arr["planets"]["lon"] % 360
+    """
+    _check_numpy()
+    planets = positions["planets"]
+    rows = [
+        (p["lon"], p["lat"], p["speed_lon"], p["retrograde"]) for p in planets.values()
+    ]
+    houses = positions["houses"]
+    return {
+        "planet_ids": tuple(planets),
+        "planets": np.array(rows, dtype=PLANET_DTYPE),
+        "houses": None if houses is None else houses_from_dict(houses),
+    }
+
+
+def to_dict(positions: LayerPositionsArray) -> LayerPositions:
+    """
+    Convert a LayerPositionsArray back to LayerPositions.
+
+    Args:
+        positions: LayerPositionsArray
+
+    Returns:
+        LayerPositions dict with plain Python floats and bools
+    """
+    rows = positions["planets"].tolist()
+    return {
+        "planets": {
+            planet_id: {"lon": lon, "lat": lat, "speed_lon": speed_lon, "retrograde": retrograde}
+            for planet_id, (lon, lat, speed_lon, retrograde) in zip(
+                positions["planet_ids"], rows
+            )
+        },
+        "houses": None if positions["houses"] is None else houses_to_dict(positions["houses"]),
+    }
+
+
+def soa_from_dict(positions: LayerPositions) -> LayerPositionsSoA:
+    """
+    Convert LayerPositions to a LayerPositionsSoA.
+
+    Unlike the fields of a LayerPositionsArray, which are strided views into
+    one structured array, each column is its own contiguous array.
+
+    Args:
+        positions: LayerPositions dict
+
+    Returns:
+        LayerPositionsSoA with one array per planet field and houses as a
+        HousePositionsArray
+
+    Raises:
+        ImportError: If NumPy is not installed
+
+    Example:
+        >>> soa = soa_from_dict(positions)
+        >>> (soa["lon"] + ayanamsa) % 360
+    """
+    _check_numpy()
+    planets = positions["planets"]
+    values = planets.values()
+    count = len(planets)
+    houses = positions["houses"]
+    return {
+        "planet_ids": tuple(planets),
+        "lon": np.fromiter((p["lon"] for p in values), dtype="f8", count=count),
+        "lat": np.fromiter((p["lat"] for p in values), dtype="f8", count=count),
+        "speed_lon": np.fromiter((p["speed_lon"] for p in values), dtype="f8", count=count),
+        "retrograde": np.fromiter((p["retrograde"] for p in values), dtype="?", count=count),
+        "houses": None if houses is None else houses_from_dict(houses),
+    }
+
+
+def soa_to_dict(positions: LayerPositionsSoA) -> LayerPositions:
+    """
+    Convert a LayerPositionsSoA back to LayerPositions.
+
+    Args:
+        positions: LayerPositionsSoA
+
+    Returns:
+        LayerPositions dict with plain Python floats and bools
+    """
+    return {
+        "planets": {
+            planet_id: {"lon": lon, "lat": lat, "speed_lon": speed_lon, "retrograde": retrograde}
+            for planet_id, lon, lat, speed_lon, retrograde in zip(
+                positions["planet_ids"],
+                positions["lon"].tolist(),
+                positions["lat"].tolist(),
+                positions["speed_lon"].tolist(),
+                positions["retrograde"].tolist(),
+            )
+        },
+        "houses": None if positions["houses"] is None else houses_to_dict(positions["houses"]),
+    }
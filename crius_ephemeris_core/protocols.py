@@ -5,17 +5,23 @@ These protocols define the interface that ephemeris adapter implementations must
 """
 
 from datetime import datetime
-from typing import Protocol, Optional
+from typing import Protocol, Optional, Sequence, runtime_checkable
 
-from .types import EphemerisSettings, GeoLocation, LayerPositions
+from .types import EphemerisSettings, GeoLocation, LayerPositions, LayerPositionsBatch
 
 
+@runtime_checkable
 class EphemerisAdapter(Protocol):
     """
     Protocol for ephemeris calculation adapters.
 
     Implementations of this protocol provide ephemeris calculations
     using various underlying libraries (Swiss Ephemeris, PyEphem, etc.).
+
+    Returned LayerPositions may be cached and shared between callers, so they
+    are treated as immutable: adapters must not modify a result after
+    returning it, and callers must not modify results they receive.
+    CachedEphemerisService enforces this by freezing results before caching.
     """
 
     def calc_positions(
@@ -41,3 +47,73 @@ class EphemerisAdapter(Protocol):
         """
         ...
 
+
+@runtime_checkable
+class BatchEphemerisAdapter(EphemerisAdapter, Protocol):
+    """
+    Protocol for adapters that can calculate positions for many datetimes at once.
+
+    Implementing ``calc_positions_batch`` is optional. Services check for it
+    and fall back to calling ``calc_positions`` once per datetime when it is
+    missing, so adapters only need it when they can push the loop down into
+    vectorized code (e.g. NumPy or a C library).
+    """
+
+    def calc_positions_batch(
+        self,
+        dt_utc_array: Sequence[datetime],
+        location: Optional[GeoLocation],
+        settings: EphemerisSettings,
+    ) -> LayerPositionsBatch:
+        """
+        Calculate planetary and house positions for a series of datetimes.
+
+        Args:
+            dt_utc_array: UTC datetimes for the calculation (a sequence of
+                datetime objects or a NumPy ``datetime64`` array)
+            location: Optional geographic location (required for house calculations)
+            settings: Ephemeris calculation settings
+
+        Returns:
+            LayerPositionsBatch with one column entry per datetime, in input order
+
+        Raises:
+            Various exceptions depending on implementation
+        """
+        ...
+
+
+@runtime_checkable
+class ParallelEphemerisAdapter(EphemerisAdapter, Protocol):
+    """
+    Protocol for adapters that can calculate many independent positions in one call.
+
+    Implementing ``calc_positions_many`` is optional. Services check for it and
+    otherwise fan ``calc_positions`` calls out over a thread pool, which only
+    runs in parallel if the adapter releases the GIL while calculating.
+    Adapters backed by a C library (Cython or a C extension) should release
+    the GIL around the library calls (``with nogil:`` in Cython,
+    ``Py_BEGIN_ALLOW_THREADS`` in C) in both methods.
+    """
+
+    def calc_positions_many(
+        self,
+        dt_utc_array: Sequence[datetime],
+        locations: Sequence[Optional[GeoLocation]],
+        settings: EphemerisSettings,
+    ) -> list[LayerPositions]:
+        """
+        Calculate planetary and house positions for many datetime/location pairs.
+
+        Args:
+            dt_utc_array: UTC datetimes for the calculation
+            locations: Geographic location for each datetime (None for no houses)
+            settings: Ephemeris calculation settings, shared by all calculations
+
+        Returns:
+            One LayerPositions per datetime, in input order
+
+        Raises:
+            Various exceptions depending on implementation
+        """
+        ...
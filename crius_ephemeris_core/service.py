@@ -1,33 +1,45 @@
 """
 Core service interfaces for ephemeris calculations.
 
-This module provides abstract base classes and service patterns for ephemeris
+This module provides service protocols and base implementations for ephemeris
 calculations. These are optional interfaces that can be used to build service
 layers on top of adapters.
 """
 
-from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Optional, Protocol
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from itertools import repeat
+from operator import itemgetter
+from typing import Any, Callable, Hashable, Literal, Optional, Protocol, Sequence, cast
+from typing import runtime_checkable
 
 from .types import (
     EphemerisSettings,
     GeoLocation,
     LayerPositions,
+    LayerPositionsBatch,
     LayerContext,
+    PlanetPositionSeries,
+    VedicOptions,
+    freeze_layer_positions,
+    _LayerPositionsSlot,
 )
 from .protocols import EphemerisAdapter
 
 
-class EphemerisService(ABC):
+@runtime_checkable
+class EphemerisService(Protocol):
     """
-    Abstract base class for ephemeris services.
+    Protocol for ephemeris services.
 
     Services provide a higher-level interface than adapters, potentially
     including caching, error handling, logging, and other cross-cutting concerns.
+    Any class with matching methods is an EphemerisService; no subclassing needed.
     """
 
-    @abstractmethod
     def get_positions(
         self,
         dt_utc: datetime,
@@ -48,9 +60,8 @@ class EphemerisService(ABC):
         Raises:
             Various exceptions depending on implementation
         """
-        pass
+        ...
 
-    @abstractmethod
     def get_positions_for_context(self, context: LayerContext) -> LayerPositions:
         """
         Get ephemeris positions from a LayerContext.
@@ -64,12 +75,12 @@ class EphemerisService(ABC):
         Raises:
             Various exceptions depending on implementation
         """
-        pass
+        ...
 
 
-class BaseEphemerisService(EphemerisService):
+class BaseEphemerisService:
     """
-    Base implementation of EphemerisService.
+    Base implementation of the EphemerisService protocol.
 
     Provides common patterns like adapter delegation and basic error handling.
     Subclasses can override methods to add caching, logging, etc.
@@ -84,6 +95,9 @@ class BaseEphemerisService(EphemerisService):
         """
         self.adapter = adapter
 
+    # Extracts (datetime, location, settings) from a LayerContext in one call
+    _unpack_context = staticmethod(itemgetter("datetime", "location", "settings"))
+
     def get_positions(
         self,
         dt_utc: datetime,
@@ -97,17 +111,123 @@ class BaseEphemerisService(EphemerisService):
         """
         return self.adapter.calc_positions(dt_utc, location, settings)
 
+    def get_positions_batch(
+        self,
+        dt_utc_array: Sequence[datetime],
+        location: Optional[GeoLocation],
+        settings: EphemerisSettings,
+    ) -> LayerPositionsBatch:
+        """
+        Get ephemeris positions for a series of datetimes.
+
+        Delegates to the adapter's ``calc_positions_batch`` when it provides
+        one (see BatchEphemerisAdapter). Otherwise calls get_positions once
+        per datetime and stacks the results column-wise.
+
+        Args:
+            dt_utc_array: UTC datetimes (a sequence of datetime objects or a
+                NumPy ``datetime64`` array)
+            location: Optional geographic location (required for houses)
+            settings: Ephemeris calculation settings
+
+        Returns:
+            LayerPositionsBatch with one column entry per datetime
+        """
+        calc_batch = getattr(self.adapter, "calc_positions_batch", None)
+        if calc_batch is not None:
+            return cast(LayerPositionsBatch, calc_batch(dt_utc_array, location, settings))
+
+        return _stack_positions(
+            [
+                self.get_positions(dt_utc, location, settings)
+                for dt_utc in _as_datetimes(dt_utc_array)
+            ]
+        )
+
+    def get_positions_many(
+        self,
+        dt_utc_array: Sequence[datetime],
+        locations: Sequence[Optional[GeoLocation]],
+        settings: EphemerisSettings,
+        max_workers: Optional[int] = None,
+    ) -> list[LayerPositions]:
+        """
+        Get ephemeris positions for many datetime/location pairs.
+
+        Delegates to the adapter's ``calc_positions_many`` when it provides
+        one (see ParallelEphemerisAdapter). Otherwise calls get_positions for
+        each pair on a thread pool; this only speeds things up for adapters
+        that release the GIL while calculating.
+
+        Args:
+            dt_utc_array: UTC datetimes (a sequence of datetime objects or a
+                NumPy ``datetime64`` array)
+            locations: Geographic location for each datetime (None for no houses)
+            settings: Ephemeris calculation settings, shared by all calculations
+            max_workers: Thread pool size for the fallback (defaults to the CPU count)
+
+        Returns:
+            One LayerPositions per datetime, in input order
+
+        Raises:
+            ValueError: If dt_utc_array and locations differ in length
+        """
+        if len(dt_utc_array) != len(locations):
+            raise ValueError("dt_utc_array and locations must have the same length")
+
+        calc_many = getattr(self.adapter, "calc_positions_many", None)
+        if calc_many is not None:
+            return cast(list[LayerPositions], calc_many(dt_utc_array, locations, settings))
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(
+                executor.map(
+                    self.get_positions, _as_datetimes(dt_utc_array), locations, repeat(settings)
+                )
+            )
+
     def get_positions_for_context(self, context: LayerContext) -> LayerPositions:
         """
         Get ephemeris positions from a LayerContext.
 
         Extracts parameters from context and calls get_positions.
         """
-        return self.get_positions(
-            context["datetime"],
-            context["location"],
-            context["settings"],
-        )
+        dt_utc, location, settings = self._unpack_context(context)
+        return self.get_positions(dt_utc, location, settings)
+
+
+def _as_datetimes(dt_utc_array: Sequence[datetime]) -> Sequence[datetime]:
+    """Convert a NumPy datetime64 array to datetime objects; pass sequences through."""
+    if hasattr(dt_utc_array, "astype"):
+        return cast(Sequence[datetime], dt_utc_array.astype("datetime64[us]").tolist())
+    return dt_utc_array
+
+
+def _stack_positions(results: Sequence[LayerPositions]) -> LayerPositionsBatch:
+    """Stack per-datetime LayerPositions into column-wise LayerPositionsBatch."""
+    planet_ids = results[0]["planets"].keys() if results else ()
+    planets: dict[str, PlanetPositionSeries] = {}
+    for planet_id in planet_ids:
+        positions = [result["planets"][planet_id] for result in results]
+        planets[planet_id] = {
+            "lon": [position["lon"] for position in positions],
+            "lat": [position["lat"] for position in positions],
+            "speed_lon": [position["speed_lon"] for position in positions],
+            "retrograde": [position["retrograde"] for position in positions],
+        }
+
+    houses = [result["houses"] for result in results]
+    return {
+        "planets": planets,
+        "houses": None if all(h is None for h in houses) else houses,
+    }
+
+
+def _sorted_objects(settings: EphemerisSettings) -> tuple[str, ...]:
+    """Return include_objects as a sorted tuple, whatever order the caller used."""
+    # Always sorted: tuples are ordinary input for a Sequence[str], and sorting
+    # a handful of (usually interned) object IDs is cheap
+    return tuple(sorted(settings.get("include_objects", ())))
 
 
 class CacheProvider(Protocol):
@@ -116,13 +236,18 @@ class CacheProvider(Protocol):
 
     Implementations can provide different caching strategies
     (in-memory, Redis, etc.).
+
+    Keys are hashable values (tuples for the default key function). Providers
+    backed by a store that needs string keys, such as Redis, should convert
+    with ``repr(key)`` when talking to the store; default keys hold aware
+    datetimes in UTC, so equal keys have equal reprs.
     """
 
-    def get(self, key: str) -> Optional[LayerPositions]:
+    def get(self, key: Hashable) -> Optional[LayerPositions]:
         """Get cached value by key."""
         ...
 
-    def set(self, key: str, value: LayerPositions) -> None:
+    def set(self, key: Hashable, value: LayerPositions) -> None:
         """Set cached value."""
         ...
 
@@ -130,6 +255,145 @@ class CacheProvider(Protocol):
         """Clear all cached values."""
         ...
 
+    def compute_if_absent(
+        self, key: Hashable, factory: Callable[[], LayerPositions]
+    ) -> LayerPositions:
+        """
+        Get cached value by key, computing and caching it with factory on a miss.
+
+        Optional: providers that do not define it are used through get/set.
+        Providers can implement it to look the key up once per call.
+        """
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value)
+        return value
+
+
+class LRUCacheProvider:
+    """
+    In-process CacheProvider with least-recently-used eviction.
+
+    Stores references to the cached LayerPositions (no serialization), so
+    hits cost a dict lookup. Useful on its own or as the local tier of a
+    TieredCacheProvider in front of a remote cache.
+
+    With ``compact=True`` entries are stored as slotted dataclasses instead,
+    trading a conversion back to dicts on every hit for a much smaller
+    footprint per entry - useful for very large caches. Hits are rebuilt as
+    read-only dicts, like the frozen results stored uncompacted.
+    """
+
+    def __init__(self, maxsize: int = 4096, compact: bool = False):
+        """
+        Initialize LRU cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            compact: Store entries in compact form and rebuild read-only dicts on hits
+
+        Raises:
+            ValueError: If maxsize is less than 1
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.compact = compact
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[LayerPositions]:
+        """Get cached value by key, marking it as most recently used."""
+        try:
+            value = self._data[key]
+            self._data.move_to_end(key)
+        except KeyError:
+            # Missing, or evicted concurrently by another thread
+            return None
+        return cast(LayerPositions, value.to_frozen() if self.compact else value)
+
+    def set(self, key: Hashable, value: LayerPositions) -> None:
+        """Set cached value, evicting the least recently used entry if full."""
+        self._data[key] = _LayerPositionsSlot.from_dict(value) if self.compact else value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        self._data.clear()
+
+    def compute_if_absent(
+        self, key: Hashable, factory: Callable[[], LayerPositions]
+    ) -> LayerPositions:
+        """Get cached value by key, computing and caching it with factory on a miss."""
+        try:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return cast(LayerPositions, value.to_frozen() if self.compact else value)
+        except KeyError:
+            pass
+        value = factory()
+        self.set(key, value)
+        return value
+
+
+class TieredCacheProvider:
+    """
+    Two-level CacheProvider: a fast local cache in front of a remote one.
+
+    Lookups check the local cache first and fall back to the remote cache,
+    back-filling the local cache on a remote hit. Writes go to both.
+    """
+
+    def __init__(self, local: CacheProvider, remote: CacheProvider):
+        """
+        Initialize tiered cache.
+
+        Args:
+            local: Local cache checked first (e.g. LRUCacheProvider)
+            remote: Remote cache used on local misses (e.g. a Redis provider)
+        """
+        self.local = local
+        self.remote = remote
+
+    def get(self, key: Hashable) -> Optional[LayerPositions]:
+        """Get cached value by key from the local cache, then the remote cache."""
+        value = self.local.get(key)
+        if value is not None:
+            return value
+        value = self.remote.get(key)
+        if value is not None:
+            self.local.set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: LayerPositions) -> None:
+        """Set cached value in both caches."""
+        self.local.set(key, value)
+        self.remote.set(key, value)
+
+    def clear(self) -> None:
+        """Clear all cached values in both caches."""
+        self.local.clear()
+        self.remote.clear()
+
+    def compute_if_absent(
+        self, key: Hashable, factory: Callable[[], LayerPositions]
+    ) -> LayerPositions:
+        """Get cached value from either cache, computing and caching it on a miss."""
+        value = self.local.get(key)
+        if value is None:
+            value = self.remote.get(key)
+            if value is None:
+                value = factory()
+                self.remote.set(key, value)
+            self.local.set(key, value)
+        return value
+
 
 class CachedEphemerisService(BaseEphemerisService):
     """
@@ -156,17 +420,41 @@ class CachedEphemerisService(BaseEphemerisService):
         self.cache = cache
         self.cache_key_fn = cache_key_fn or self._default_cache_key
 
+    @property
+    def cache(self) -> Optional[CacheProvider]:
+        """Cache provider (None disables caching)."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: Optional[CacheProvider]) -> None:
+        self._cache = cache
+        # Bind the lookup once so get_positions skips the attribute hops per call
+        if cache is None:
+            self._compute_if_absent = None
+        else:
+            self._compute_if_absent = getattr(cache, "compute_if_absent", None) or partial(
+                CacheProvider.compute_if_absent, cache
+            )
+
     def _default_cache_key(
         self,
         dt_utc: datetime,
         location: Optional[GeoLocation],
         settings: EphemerisSettings,
-    ) -> str:
+    ) -> Hashable:
         """Generate default cache key from parameters."""
-        location_str = f"{location['lat']},{location['lon']}" if location else "None"
-        settings_str = f"{settings['zodiac_type']}:{settings['house_system']}"
-        objects_str = ",".join(sorted(settings.get("include_objects", [])))
-        return f"{dt_utc.isoformat()}:{location_str}:{settings_str}:{objects_str}"
+        # The datetime itself is the cheapest key part: it hashes in C without
+        # building a string or an int. Aware datetimes are converted to UTC so
+        # keys for the same instant also share a repr (for string-keyed
+        # stores); a naive datetime never equals an aware one.
+        return (
+            dt_utc if dt_utc.tzinfo is None else dt_utc.astimezone(timezone.utc),
+            (location["lat"], location["lon"]) if location else None,
+            settings["zodiac_type"],
+            settings.get("ayanamsa"),
+            settings["house_system"],
+            _sorted_objects(settings),
+        )
 
     def get_positions(
         self,
@@ -177,19 +465,97 @@ class CachedEphemerisService(BaseEphemerisService):
         """
         Get positions with caching.
 
-        Checks cache first, then calculates if not found.
+        Checks cache first, then calculates if not found. Results are frozen
+        with freeze_layer_positions before caching, so hits return the shared
+        cached object without copying.
         """
-        if self.cache is None:
+        compute_if_absent = self._compute_if_absent
+        if compute_if_absent is None:
             return super().get_positions(dt_utc, location, settings)
 
-        cache_key = self.cache_key_fn(dt_utc, location, settings)
-        cached = self.cache.get(cache_key)
-        if cached is not None:
-            return cached
+        calc_positions = super().get_positions
+        return compute_if_absent(
+            self.cache_key_fn(dt_utc, location, settings),
+            lambda: freeze_layer_positions(calc_positions(dt_utc, location, settings)),
+        )
 
-        positions = super().get_positions(dt_utc, location, settings)
-        self.cache.set(cache_key, positions)
-        return positions
+
+class MemoizedEphemerisService(BaseEphemerisService):
+    """
+    EphemerisService that memoizes results in-process with functools.lru_cache.
+
+    A lighter alternative to CachedEphemerisService for single-process
+    workloads that do not need a pluggable CacheProvider: inputs are reduced
+    to hashable arguments and looked up in lru_cache's C-implemented table.
+    Results are frozen (see freeze_layer_positions) and shared between callers.
+    """
+
+    def __init__(self, adapter: EphemerisAdapter, maxsize: Optional[int] = 4096):
+        """
+        Initialize memoized service.
+
+        Args:
+            adapter: EphemerisAdapter instance
+            maxsize: Maximum number of memoized results (None for unbounded)
+        """
+        super().__init__(adapter)
+        self._memoized = lru_cache(maxsize=maxsize)(self._compute)
+        self.cache_info = self._memoized.cache_info
+        self.cache_clear = self._memoized.cache_clear
+
+    def _compute(
+        self,
+        dt_utc: datetime,
+        location_key: Optional[tuple[float, float]],
+        zodiac_type: Literal["tropical", "sidereal"],
+        ayanamsa: Optional[str],
+        house_system: str,
+        include_objects: tuple[str, ...],
+        vedic_items: Optional[tuple[tuple[str, Any], ...]],
+    ) -> LayerPositions:
+        """Rebuild the adapter arguments from hashable values and calculate."""
+        location: Optional[GeoLocation] = None
+        if location_key is not None:
+            location = {"lat": location_key[0], "lon": location_key[1]}
+        settings: EphemerisSettings = {
+            "zodiac_type": zodiac_type,
+            "ayanamsa": ayanamsa,
+            "house_system": house_system,
+            "include_objects": include_objects,
+        }
+        if vedic_items is not None:
+            settings["vedic_options"] = cast(VedicOptions, {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in vedic_items
+            })
+        return freeze_layer_positions(self.adapter.calc_positions(dt_utc, location, settings))
+
+    def get_positions(
+        self,
+        dt_utc: datetime,
+        location: Optional[GeoLocation],
+        settings: EphemerisSettings,
+    ) -> LayerPositions:
+        """
+        Get positions, memoized on the datetime, location and settings.
+
+        The adapter receives include_objects as a sorted tuple.
+        """
+        vedic_options = settings.get("vedic_options")
+        return self._memoized(
+            dt_utc,
+            None if location is None else (location["lat"], location["lon"]),
+            settings["zodiac_type"],
+            settings.get("ayanamsa"),
+            settings["house_system"],
+            _sorted_objects(settings),
+            None if vedic_options is None else tuple(
+                sorted(
+                    (key, tuple(value) if isinstance(value, list) else value)
+                    for key, value in vedic_options.items()
+                )
+            ),
+        )
 
 
 def create_ephemeris_service(
@@ -5,16 +5,19 @@ This module provides utilities to test that adapter implementations conform
 to the EphemerisAdapter protocol.
 """
 
+import functools
 import inspect
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Type
-from typing import get_type_hints, get_origin, get_args
+import weakref
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Callable, Type, Sequence, Tuple
+from typing import get_type_hints, get_args
 
 from .protocols import EphemerisAdapter
 from .types import (
     EphemerisSettings,
     GeoLocation,
     LayerPositions,
+    LayerPositionsBatch,
     PlanetPosition,
     HousePositions,
 )
@@ -28,10 +31,74 @@ class ProtocolConformanceError(Exception):
         self.errors = errors
 
 
+# Adapter classes that passed verify_adapter_protocol without errors
+_VALIDATED_CLASSES: weakref.WeakSet[type] = weakref.WeakSet()
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_signature(func: Any) -> inspect.Signature:
+    """Return inspect.signature(func), memoized per function object."""
+    return inspect.signature(func)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_type_hints(func: Any) -> Dict[str, Any]:
+    """Return get_type_hints(func), memoized per function object."""
+    return get_type_hints(func)
+
+
+def _signature(func: Any) -> inspect.Signature:
+    """Return inspect.signature(func), memoized unless func is unhashable."""
+    try:
+        return _cached_signature(func)
+    except TypeError:
+        # Unhashable callables (e.g. dataclass instances with __call__) are
+        # still valid calc_positions methods; inspect them uncached
+        return inspect.signature(func)
+
+
+def _type_hints(func: Any) -> Dict[str, Any]:
+    """Return get_type_hints(func), memoized unless func is unhashable."""
+    try:
+        return _cached_type_hints(func)
+    except TypeError:
+        return get_type_hints(func)
+
+
+# Expected calc_positions parameters and annotations, resolved once at import
+_EXPECTED_PARAMS = ("dt_utc", "location", "settings")
+_EXPECTED_HINTS: Dict[str, Any] = {
+    "dt_utc": datetime,
+    "location": Optional[GeoLocation],
+    "settings": EphemerisSettings,
+    "return": LayerPositions,
+}
+_HINT_ERRORS = {
+    "dt_utc": "calc_positions 'dt_utc' parameter must be datetime",
+    "location": "calc_positions 'location' parameter must be Optional[GeoLocation]",
+    "settings": "calc_positions 'settings' parameter must be EphemerisSettings",
+    "return": "calc_positions must return LayerPositions",
+}
+
+
+def invalidate_validation_cache() -> None:
+    """
+    Forget which adapter classes verify_adapter_protocol has already accepted.
+
+    Use this in tests that redefine or reload adapter classes.
+    """
+    _VALIDATED_CLASSES.clear()
+    _cached_signature.cache_clear()
+    _cached_type_hints.cache_clear()
+
+
 def verify_adapter_protocol(adapter: Any) -> List[str]:
     """
     Verify that an adapter conforms to the EphemerisAdapter protocol.
 
+    Classes that pass are remembered, so later checks of the same adapter
+    class return immediately (see invalidate_validation_cache).
+
     Args:
         adapter: Adapter instance to verify
 
@@ -43,6 +110,10 @@ def verify_adapter_protocol(adapter: Any) -> List[str]:
         >>> if errors:
         ...     print("Protocol errors:", errors)
     """
+    adapter_class = type(adapter)
+    if adapter_class in _VALIDATED_CLASSES:
+        return []
+
     errors: List[str] = []
 
     # Check that adapter has calc_positions method
@@ -51,58 +122,44 @@ def verify_adapter_protocol(adapter: Any) -> List[str]:
         return errors
 
     method = getattr(adapter, "calc_positions")
+    # Unwrap bound methods so results are shared by all instances of a class
+    func = getattr(method, "__func__", method)
 
     # Check method signature
     try:
-        sig = inspect.signature(method)
-        params = list(sig.parameters.keys())
+        params = _signature(func).parameters
 
         # Check required parameters
-        if "dt_utc" not in params:
-            errors.append("calc_positions must have 'dt_utc' parameter")
-        if "location" not in params:
-            errors.append("calc_positions must have 'location' parameter")
-        if "settings" not in params:
-            errors.append("calc_positions must have 'settings' parameter")
-
-        # Check parameter types (if annotations are available)
-        annotations = get_type_hints(method)
-        if "dt_utc" in annotations:
-            if annotations["dt_utc"] != datetime:
-                errors.append(
-                    f"calc_positions 'dt_utc' parameter must be datetime, "
-                    f"got {annotations['dt_utc']}"
-                )
-        if "location" in annotations:
-            location_type = annotations["location"]
-            if get_origin(location_type) is not Optional:
-                args = get_args(location_type)
-                if GeoLocation not in args:
-                    errors.append(
-                        f"calc_positions 'location' parameter must be "
-                        f"Optional[GeoLocation], got {location_type}"
-                    )
-        if "settings" in annotations:
-            if annotations["settings"] != EphemerisSettings:
-                errors.append(
-                    f"calc_positions 'settings' parameter must be "
-                    f"EphemerisSettings, got {annotations['settings']}"
-                )
-
-        # Check return type
-        if "return" in annotations:
-            if annotations["return"] != LayerPositions:
-                errors.append(
-                    f"calc_positions must return LayerPositions, "
-                    f"got {annotations['return']}"
-                )
+        for name in _EXPECTED_PARAMS:
+            if name not in params:
+                errors.append(f"calc_positions must have '{name}' parameter")
+
+        # Check parameter and return types (if annotations are available)
+        annotations = _type_hints(func)
+        for name, expected in _EXPECTED_HINTS.items():
+            if name not in annotations:
+                continue
+            actual = annotations[name]
+            if name == "location":
+                # Accept any Optional/Union that includes GeoLocation
+                matches = GeoLocation in get_args(actual)
+            else:
+                matches = actual == expected
+            if not matches:
+                errors.append(f"{_HINT_ERRORS[name]}, got {actual}")
 
     except Exception as e:
         errors.append(f"Error checking method signature: {e}")
 
+    if not errors:
+        _VALIDATED_CLASSES.add(adapter_class)
     return errors
 
 
+_REQUIRED_PLANET_FIELDS = frozenset({"lon", "lat", "speed_lon", "retrograde"})
+_REQUIRED_HOUSE_FIELDS = frozenset({"system", "cusps", "angles"})
+
+
 def verify_adapter_runtime(
     adapter: Any,
     dt_utc: Optional[datetime] = None,
@@ -166,12 +223,12 @@ def verify_adapter_runtime(
                     if not isinstance(position, dict):
                         errors.append(f"Planet positions must be dicts, got {type(position)}")
                     else:
-                        required_fields = ["lon", "lat", "speed_lon", "retrograde"]
-                        for field in required_fields:
-                            if field not in position:
-                                errors.append(
-                                    f"Planet position must have '{field}' field"
-                                )
+                        missing = _REQUIRED_PLANET_FIELDS - position.keys()
+                        if missing:
+                            errors.extend(
+                                f"Planet position must have '{field}' field"
+                                for field in sorted(missing)
+                            )
 
         # Verify houses structure (if present)
         if "houses" in result and result["houses"] is not None:
@@ -179,10 +236,12 @@ def verify_adapter_runtime(
             if not isinstance(houses, dict):
                 errors.append("'houses' must be a dict or None")
             else:
-                required_fields = ["system", "cusps", "angles"]
-                for field in required_fields:
-                    if field not in houses:
-                        errors.append(f"House positions must have '{field}' field")
+                missing = _REQUIRED_HOUSE_FIELDS - houses.keys()
+                if missing:
+                    errors.extend(
+                        f"House positions must have '{field}' field"
+                        for field in sorted(missing)
+                    )
 
     except Exception as e:
         errors.append(f"Runtime error calling calc_positions: {e}")
@@ -237,6 +296,183 @@ class MockEphemerisAdapter:
         return self.return_value
 
 
+_J2000 = datetime(2000, 1, 1, 12, 0, 0)
+
+# Planet ID -> (longitude at J2000 in degrees, mean daily motion in degrees)
+_DEFAULT_MEAN_MOTIONS: Dict[str, Tuple[float, float]] = {
+    "sun": (280.46, 0.9856),
+    "moon": (218.32, 13.1764),
+    "mercury": (252.25, 4.0923),
+    "venus": (181.98, 1.6021),
+    "mars": (355.43, 0.5240),
+}
+
+
+def _fill(
+    out_lon: Any,
+    out_lat: Any,
+    out_speed: Any,
+    out_retro: Any,
+    t_array: Any,
+    lon0: Any,
+    speed: Any,
+) -> None:
+    """Fill (n_planets, n_times) output arrays with linear mean-motion positions."""
+    for i in range(lon0.shape[0]):
+        retrograde = speed[i] < 0.0
+        for j in range(t_array.shape[0]):
+            out_lon[i, j] = (lon0[i] + speed[i] * t_array[j]) % 360.0
+            out_lat[i, j] = 0.0
+            out_speed[i, j] = speed[i]
+            out_retro[i, j] = retrograde
+
+
+@functools.cache
+def _fill_kernel() -> Callable[..., None]:
+    """
+    Return _fill compiled with numba, or _fill itself without numba.
+
+    numba is imported on first use by NumbaMockAdapter rather than with this
+    module, so importing the testing utilities does not pay for it.
+    """
+    try:
+        from numba import njit  # type: ignore[import-not-found]
+    except ImportError:
+        return _fill
+    kernel: Callable[..., None] = njit(cache=True)(_fill)
+    return kernel
+
+
+def _days_since_j2000(dt: datetime) -> float:
+    """Convert a UTC datetime (naive or aware) to days since J2000."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _J2000).total_seconds() / 86400.0
+
+
+class NumbaMockAdapter:
+    """
+    Numeric mock adapter for benchmarks and high-iteration conformance tests.
+
+    Positions follow simple linear mean motions and are computed by a kernel
+    that writes into preallocated NumPy arrays. The kernel is compiled with
+    numba when it is installed and runs as plain Python otherwise.
+    Requires NumPy.
+    """
+
+    def __init__(self, mean_motions: Optional[Dict[str, Tuple[float, float]]] = None):
+        """
+        Initialize numeric mock adapter.
+
+        Args:
+            mean_motions: Optional mapping of planet ID to (longitude at J2000
+                in degrees, daily motion in degrees). Negative motions are
+                reported as retrograde. Defaults to the Sun, Moon, Mercury,
+                Venus and Mars.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        # Imported here, since importing arrays imports NumPy
+        from . import arrays
+
+        arrays._check_numpy()
+        np = arrays.np
+        self._np = np
+        self._fill = _fill_kernel()
+        mean_motions = mean_motions or _DEFAULT_MEAN_MOTIONS
+        self.planet_ids = tuple(mean_motions)
+        self._lon0 = np.array([m[0] for m in mean_motions.values()], dtype=np.float64)
+        self._speed = np.array([m[1] for m in mean_motions.values()], dtype=np.float64)
+
+    def fill(
+        self, t_array: Any, out_lon: Any, out_lat: Any, out_speed: Any, out_retro: Any
+    ) -> None:
+        """
+        Write positions for all planets into preallocated arrays.
+
+        Args:
+            t_array: float64 array of days since J2000, shape (n_times,)
+            out_lon: float64 output array, shape (n_planets, n_times)
+            out_lat: float64 output array, shape (n_planets, n_times)
+            out_speed: float64 output array, shape (n_planets, n_times)
+            out_retro: bool output array, shape (n_planets, n_times)
+
+        Rows are in ``planet_ids`` order.
+        """
+        self._fill(out_lon, out_lat, out_speed, out_retro, t_array, self._lon0, self._speed)
+
+    def _calc(self, t_array: Any) -> Tuple[Any, Any, Any, Any]:
+        """Allocate output arrays and fill them for the given times."""
+        np = self._np
+        shape = (len(self.planet_ids), t_array.shape[0])
+        out_lon = np.empty(shape, dtype=np.float64)
+        out_lat = np.empty(shape, dtype=np.float64)
+        out_speed = np.empty(shape, dtype=np.float64)
+        out_retro = np.empty(shape, dtype=np.bool_)
+        self.fill(t_array, out_lon, out_lat, out_speed, out_retro)
+        return out_lon, out_lat, out_speed, out_retro
+
+    def calc_positions(
+        self,
+        dt_utc: datetime,
+        location: Optional[GeoLocation],
+        settings: EphemerisSettings,
+    ) -> LayerPositions:
+        """Calculate positions (mock implementation)."""
+        np = self._np
+        t_array = np.array([_days_since_j2000(dt_utc)], dtype=np.float64)
+        out_lon, out_lat, out_speed, out_retro = self._calc(t_array)
+        include = settings.get("include_objects") or self.planet_ids
+        return {
+            "planets": {
+                planet_id: {
+                    "lon": float(out_lon[i, 0]),
+                    "lat": float(out_lat[i, 0]),
+                    "speed_lon": float(out_speed[i, 0]),
+                    "retrograde": bool(out_retro[i, 0]),
+                }
+                for i, planet_id in enumerate(self.planet_ids)
+                if planet_id in include
+            },
+            "houses": None,
+        }
+
+    def calc_positions_batch(
+        self,
+        dt_utc_array: Sequence[datetime],
+        location: Optional[GeoLocation],
+        settings: EphemerisSettings,
+    ) -> LayerPositionsBatch:
+        """Calculate positions for a series of datetimes (mock implementation)."""
+        np = self._np
+        if hasattr(dt_utc_array, "astype"):
+            t_array = (
+                dt_utc_array.astype("datetime64[ns]") - np.datetime64(_J2000, "ns")
+            ) / np.timedelta64(1, "D")
+        else:
+            t_array = np.fromiter(
+                (_days_since_j2000(dt) for dt in dt_utc_array),
+                dtype=np.float64,
+                count=len(dt_utc_array),
+            )
+        out_lon, out_lat, out_speed, out_retro = self._calc(t_array)
+        include = settings.get("include_objects") or self.planet_ids
+        return {
+            "planets": {
+                planet_id: {
+                    "lon": out_lon[i],
+                    "lat": out_lat[i],
+                    "speed_lon": out_speed[i],
+                    "retrograde": out_retro[i],
+                }
+                for i, planet_id in enumerate(self.planet_ids)
+                if planet_id in include
+            },
+            "houses": None,
+        }
+
+
 def create_test_adapter(
     planets: Optional[Dict[str, PlanetPosition]] = None,
     houses: Optional[HousePositions] = None,
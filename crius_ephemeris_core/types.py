@@ -4,8 +4,59 @@ Core type definitions for ephemeris calculations.
 These types are pure Python TypedDict definitions with no external dependencies.
 """
 
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import TypedDict, Literal, Optional, List, NotRequired
+from enum import IntEnum
+from typing import (
+    Any, NoReturn, TypedDict, Literal, Optional, List, NotRequired, Self, Sequence, cast
+)
+
+
+class _LabeledIntEnum(IntEnum):
+    """IntEnum whose members convert to and from lower-case string labels."""
+
+    @classmethod
+    def from_label(cls, label: str) -> Self:
+        """
+        Look up the member for a string label, e.g. "tropical".
+
+        Raises:
+            ValueError: If label does not name a member
+        """
+        try:
+            return cls.__members__[label.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown {cls.__name__} label: {label!r}") from None
+
+    @property
+    def label(self) -> str:
+        """String label of this member, as used in EphemerisSettings."""
+        return self.name.lower()
+
+
+class ZodiacType(_LabeledIntEnum):
+    """
+    Integer codes for EphemerisSettings zodiac_type labels.
+
+    Settings keep the string labels; convert once with from_label() where
+    code compares zodiac types repeatedly.
+    """
+
+    TROPICAL = 0
+    SIDEREAL = 1
+
+
+class DashaDepth(_LabeledIntEnum):
+    """
+    Integer codes for VedicOptions dashas_depth labels.
+
+    Codes increase with depth, so depths can be compared with < and >.
+    """
+
+    MAHADASHA = 1
+    ANTARDASHA = 2
+    PRATYANTARDASHA = 3
 
 
 class VedicOptions(TypedDict, total=False):
@@ -30,10 +81,39 @@ class EphemerisSettings(TypedDict):
     zodiac_type: Literal["tropical", "sidereal"]
     ayanamsa: Optional[str]
     house_system: str
-    include_objects: list[str]
+    include_objects: Sequence[str]
     vedic_options: NotRequired[VedicOptions]
 
 
+def normalize_settings(settings: EphemerisSettings) -> EphemerisSettings:
+    """
+    Return a normalized copy of EphemerisSettings for repeated use.
+
+    String values are interned with sys.intern, so settings and object IDs
+    read from JSON or a database hash and compare like string literals, and
+    include_objects becomes a sorted tuple of interned IDs, which sorts and
+    hashes cheaply in cache keys. Normalize settings once, when they are
+    loaded, rather than per calculation.
+
+    Args:
+        settings: EphemerisSettings to normalize
+
+    Returns:
+        New EphemerisSettings with interned strings and a sorted include_objects tuple
+    """
+    normalized = settings.copy()
+    normalized["zodiac_type"] = cast(
+        Literal["tropical", "sidereal"], sys.intern(settings["zodiac_type"])
+    )
+    normalized["house_system"] = sys.intern(settings["house_system"])
+    ayanamsa = settings.get("ayanamsa")
+    normalized["ayanamsa"] = sys.intern(ayanamsa) if ayanamsa is not None else None
+    normalized["include_objects"] = tuple(
+        sorted(sys.intern(obj) for obj in settings.get("include_objects", ()))
+    )
+    return normalized
+
+
 class GeoLocation(TypedDict):
     """Geographic location coordinates."""
 
@@ -50,12 +130,21 @@ class PlanetPosition(TypedDict):
     retrograde: bool  # Whether the planet is retrograde
 
 
+class HouseAngles(TypedDict, total=False):
+    """Chart angles in degrees. Adapters may leave out angles they do not compute."""
+
+    asc: float  # Ascendant
+    mc: float  # Midheaven
+    ic: float  # Imum Coeli
+    dc: float  # Descendant
+
+
 class HousePositions(TypedDict):
     """House system positions."""
 
     system: str  # House system name
     cusps: dict[str, float]  # House cusps: "1".."12" -> degrees
-    angles: dict[str, float]  # Angles: "asc", "mc", "ic", "dc" -> degrees
+    angles: HouseAngles  # Angles: "asc", "mc", "ic", "dc" -> degrees
 
 
 class LayerPositions(TypedDict):
@@ -65,6 +154,23 @@ class LayerPositions(TypedDict):
     houses: Optional[HousePositions]  # House positions (None if no location provided)
 
 
+class PlanetPositionSeries(TypedDict):
+    """Planetary positions over a series of datetimes, stored column-wise."""
+
+    lon: Sequence[float]  # Longitudes in degrees (0-360), one per datetime
+    lat: Sequence[float]  # Latitudes in degrees, one per datetime
+    speed_lon: Sequence[float]  # Speeds in longitude (degrees per day), one per datetime
+    retrograde: Sequence[bool]  # Retrograde flags, one per datetime
+
+
+class LayerPositionsBatch(TypedDict):
+    """Position data for a chart layer over a series of datetimes."""
+
+    planets: dict[str, PlanetPositionSeries]  # Planet ID -> position columns
+    # One entry per datetime, None where no houses were computed (None if no location)
+    houses: Optional[list[Optional[HousePositions]]]
+
+
 class LayerContext(TypedDict):
     """Context for calculating positions for a chart layer."""
 
@@ -74,3 +180,157 @@ class LayerContext(TypedDict):
     location: Optional[GeoLocation]
     settings: EphemerisSettings
 
+
+class _FrozenDict(dict):
+    """
+    Read-only dict used for shared LayerPositions.
+
+    Subclasses dict so frozen results still satisfy isinstance checks and
+    serialize with json, but raises TypeError on any mutation.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple[type, tuple[dict[Any, Any]]]:
+        return (type(self), (dict(self),))
+
+
+def freeze_layer_positions(positions: LayerPositions) -> LayerPositions:
+    """
+    Return a read-only copy of LayerPositions that can be shared safely.
+
+    Planets, houses, cusps and angles are all frozen, so cached results can
+    be returned to many callers without defensive copying. Already-frozen
+    positions are returned unchanged.
+
+    Args:
+        positions: LayerPositions to freeze
+
+    Returns:
+        Read-only LayerPositions (a dict subclass that raises TypeError on mutation)
+    """
+    if isinstance(positions, _FrozenDict):
+        return cast(LayerPositions, positions)
+
+    # _FrozenDict is a dict subclass, so the frozen copies keep the TypedDict shapes
+    houses = positions["houses"]
+    if houses is not None:
+        houses = cast(HousePositions, _FrozenDict(
+            houses,
+            cusps=_FrozenDict(houses["cusps"]),
+            angles=_FrozenDict(houses["angles"]),
+        ))
+    return cast(LayerPositions, _FrozenDict(
+        planets=_FrozenDict(
+            (planet_id, _FrozenDict(position))
+            for planet_id, position in positions["planets"].items()
+        ),
+        houses=houses,
+    ))
+
+
+@dataclass(slots=True, frozen=True)
+class _PlanetPositionSlot:
+    """Compact internal form of PlanetPosition."""
+
+    lon: float
+    lat: float
+    speed_lon: float
+    retrograde: bool
+
+
+@dataclass(slots=True, frozen=True)
+class _HousePositionsSlot:
+    """Compact internal form of HousePositions (keys and values as parallel tuples)."""
+
+    system: str
+    cusp_ids: tuple[str, ...]
+    cusps: tuple[float, ...]
+    angle_ids: tuple[str, ...]
+    angles: tuple[float, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class _LayerPositionsSlot:
+    """
+    Compact internal form of LayerPositions.
+
+    Uses a fraction of the memory of the equivalent nested dicts, for caches
+    that hold many results. Convert with from_dict()/to_dict() at the
+    boundary; the public API stays dict-based.
+    """
+
+    planet_ids: tuple[str, ...]
+    planets: tuple[_PlanetPositionSlot, ...]
+    houses: Optional[_HousePositionsSlot]
+
+    @classmethod
+    def from_dict(cls, positions: LayerPositions) -> "_LayerPositionsSlot":
+        """Build from LayerPositions."""
+        planets = positions["planets"]
+        houses = positions["houses"]
+        return cls(
+            planet_ids=tuple(planets),
+            planets=tuple(
+                _PlanetPositionSlot(p["lon"], p["lat"], p["speed_lon"], p["retrograde"])
+                for p in planets.values()
+            ),
+            houses=None if houses is None else _HousePositionsSlot(
+                houses["system"],
+                tuple(houses["cusps"]),
+                tuple(houses["cusps"].values()),
+                tuple(houses["angles"]),
+                tuple(cast(dict[str, float], houses["angles"]).values()),
+            ),
+        )
+
+    def to_dict(self) -> LayerPositions:
+        """Convert back to LayerPositions."""
+        houses = self.houses
+        return {
+            "planets": {
+                planet_id: {
+                    "lon": p.lon,
+                    "lat": p.lat,
+                    "speed_lon": p.speed_lon,
+                    "retrograde": p.retrograde,
+                }
+                for planet_id, p in zip(self.planet_ids, self.planets)
+            },
+            "houses": None if houses is None else {
+                "system": houses.system,
+                "cusps": dict(zip(houses.cusp_ids, houses.cusps)),
+                "angles": cast(HouseAngles, dict(zip(houses.angle_ids, houses.angles))),
+            },
+        }
+
+    def to_frozen(self) -> LayerPositions:
+        """
+        Convert back to read-only LayerPositions.
+
+        Equivalent to freeze_layer_positions(self.to_dict()), but builds the
+        read-only dicts directly instead of copying a mutable tree.
+        """
+        houses = self.houses
+        return cast(LayerPositions, _FrozenDict(
+            planets=_FrozenDict(
+                (
+                    planet_id,
+                    _FrozenDict(
+                        lon=p.lon, lat=p.lat, speed_lon=p.speed_lon, retrograde=p.retrograde
+                    ),
+                )
+                for planet_id, p in zip(self.planet_ids, self.planets)
+            ),
+            houses=None if houses is None else _FrozenDict(
+                system=houses.system,
+                cusps=_FrozenDict(zip(houses.cusp_ids, houses.cusps)),
+                angles=_FrozenDict(zip(houses.angle_ids, houses.angles)),
+            ),
+        ))
@@ -1,28 +1,36 @@
 """
-Runtime validation utilities using Pydantic (optional dependency).
+Runtime validation utilities using Pydantic or msgspec (optional dependencies).
 
-This module provides Pydantic models for runtime validation of ephemeris types.
-Pydantic is an optional dependency - if not installed, validation functions will
+This module provides runtime validation of ephemeris types. When msgspec is
+installed, the validate_* functions use the msgspec backend in
+``validation_msgspec``; otherwise they fall back to the Pydantic models in
+``validation_pydantic``, which are only imported on first use. Both are
+optional dependencies - if neither is installed, validation functions will
 raise ImportError.
 
-To use validation, install pydantic:
+To use validation, install pydantic or msgspec:
     pip install pydantic
 
 Or install with validation support:
     pip install crius-ephemeris-core[validation]
+    pip install crius-ephemeris-core[msgspec]
 """
 
-from typing import Optional, List, Literal, Dict, Any
-from datetime import datetime
+import sys
+from functools import cache
+from importlib.util import find_spec
+from types import ModuleType
+from typing import Any, Callable, Dict
+
+# Pydantic is only located here; the models are imported on first use
+PYDANTIC_AVAILABLE = find_spec("pydantic") is not None
 
 try:
-    from pydantic import BaseModel, Field, field_validator
-    PYDANTIC_AVAILABLE = True
+    from . import validation_msgspec
+    MSGSPEC_AVAILABLE = True
 except ImportError:
-    PYDANTIC_AVAILABLE = False
-    BaseModel = None  # type: ignore
-    Field = None  # type: ignore
-    field_validator = None  # type: ignore
+    MSGSPEC_AVAILABLE = False
+    validation_msgspec = None  # type: ignore
 
 from .types import (
     EphemerisSettings,
@@ -31,119 +39,100 @@ from .types import (
     HousePositions,
     LayerPositions,
     LayerContext,
-    VedicOptions,
 )
 
+# Module __getattr__ re-exporting the Pydantic models lazily; defined in an
+# uncompiled module because mypyc cannot compile a module-level __getattr__
+from ._validation_models import __getattr__  # noqa: F401
+
+_GEO_LOCATION_KEYS = frozenset({"lat", "lon"})
+_LAYER_CONTEXT_KEYS = frozenset({"layer_id", "kind", "datetime", "location", "settings"})
 
-def _check_pydantic():
+
+def _check_pydantic() -> None:
     """Check if Pydantic is available, raise ImportError if not."""
     if not PYDANTIC_AVAILABLE:
         raise ImportError(
-            "Pydantic is required for validation. Install it with: "
+            "Pydantic or msgspec is required for validation. Install one with: "
             "pip install pydantic"
             " or pip install crius-ephemeris-core[validation]"
         )
 
 
-if PYDANTIC_AVAILABLE:
-    class VedicOptionsModel(BaseModel):
-        """Pydantic model for VedicOptions."""
-
-        include_nakshatras: Optional[bool] = None
-        enabled_vargas: Optional[List[str]] = None
-        include_dashas: Optional[bool] = None
-        dasha_systems: Optional[List[str]] = None
-        dashas_depth: Optional[Literal["mahadasha", "antardasha", "pratyantardasha"]] = None
-        include_yogas: Optional[bool] = None
-
-        class Config:
-            extra = "forbid"
-
-    class EphemerisSettingsModel(BaseModel):
-        """Pydantic model for EphemerisSettings."""
-
-        zodiac_type: Literal["tropical", "sidereal"] = Field(
-            ..., description="Zodiac type: tropical or sidereal"
-        )
-        ayanamsa: Optional[str] = Field(
-            None, description="Ayanamsa for sidereal calculations"
-        )
-        house_system: str = Field(..., description="House system name")
-        include_objects: List[str] = Field(..., description="List of objects to include")
-        vedic_options: Optional[VedicOptionsModel] = None
+@cache
+def _pydantic_backend() -> ModuleType:
+    """Import the Pydantic backend on first use."""
+    _check_pydantic()
+    from . import validation_pydantic
 
-        @field_validator("zodiac_type")
-        @classmethod
-        def validate_zodiac_type(cls, v: str) -> str:
-            """Validate zodiac type."""
-            if v not in ("tropical", "sidereal"):
-                raise ValueError("zodiac_type must be 'tropical' or 'sidereal'")
-            return v
+    return validation_pydantic
 
-        class Config:
-            extra = "forbid"
 
-    class GeoLocationModel(BaseModel):
-        """Pydantic model for GeoLocation."""
+def _intern_planet_ids(planets: Dict[str, Any]) -> Dict[str, Any]:
+    """Return planets keyed by interned planet IDs."""
+    # Position field names are already interned (they come from model/Struct
+    # field names), but planet IDs come from caller input such as decoded JSON
+    intern = sys.intern
+    return {intern(planet_id): position for planet_id, position in planets.items()}
 
-        lat: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
-        lon: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
 
-        class Config:
-            extra = "forbid"
+def _check_layer_context_keys(context: Dict[str, Any]) -> None:
+    """Reject unknown layer context keys before handing the context to a backend."""
+    if not context.keys() <= _LAYER_CONTEXT_KEYS:
+        raise ValueError(
+            f"Unknown layer context fields: {sorted(context.keys() - _LAYER_CONTEXT_KEYS)}"
+        )
 
-    class PlanetPositionModel(BaseModel):
-        """Pydantic model for PlanetPosition."""
 
-        lon: float = Field(..., ge=0, lt=360, description="Longitude in degrees (0-360)")
-        lat: float = Field(..., description="Latitude in degrees")
-        speed_lon: float = Field(..., description="Speed in longitude (degrees per day)")
-        retrograde: bool = Field(..., description="Whether the planet is retrograde")
+# The validate_* functions call _validate / _validate_json (and
+# _validate_planet_position_into), which are bound to the backend's functions
+# so the backend is not re-chosen on every call. msgspec is bound at import.
+# Pydantic is bound by the first call, which imports it; without Pydantic,
+# every call raises ImportError instead.
+_validate: Callable[[str, Dict[str, Any]], Any]
+_validate_json: Callable[[str, Dict[str, Any]], bytes]
+_validate_planet_position_into: Callable[[Dict[str, Any], Dict[str, Any]], None]
 
-        class Config:
-            extra = "forbid"
 
-    class HousePositionsModel(BaseModel):
-        """Pydantic model for HousePositions."""
+def _bind_backend(backend: ModuleType) -> None:
+    """Route _validate, _validate_json and _validate_planet_position_into to backend."""
+    global _validate, _validate_json, _validate_planet_position_into
+    _validate = backend.validate
+    _validate_json = backend.validate_json
+    _validate_planet_position_into = backend.validate_planet_position_into
 
-        system: str = Field(..., description="House system name")
-        cusps: Dict[str, float] = Field(..., description="House cusps: '1'..'12' -> degrees")
-        angles: Dict[str, float] = Field(..., description="Angles: 'asc', 'mc', 'ic', 'dc' -> degrees")
 
-        class Config:
-            extra = "forbid"
+def _validate_with_pydantic(kind: str, data: Dict[str, Any]) -> Any:
+    """Bind the Pydantic backend on first use, then validate data with it."""
+    _bind_backend(_pydantic_backend())
+    return _validate(kind, data)
 
-    class LayerPositionsModel(BaseModel):
-        """Pydantic model for LayerPositions."""
 
-        planets: Dict[str, PlanetPositionModel] = Field(
-            ..., description="Planet ID -> position"
-        )
-        houses: Optional[HousePositionsModel] = Field(
-            None, description="House positions (None if no location provided)"
-        )
+def _validate_json_with_pydantic(kind: str, data: Dict[str, Any]) -> bytes:
+    """Bind the Pydantic backend on first use, then validate and serialize data."""
+    _bind_backend(_pydantic_backend())
+    return _validate_json(kind, data)
 
-        class Config:
-            extra = "forbid"
 
-    class LayerContextModel(BaseModel):
-        """Pydantic model for LayerContext."""
+def _validate_planet_position_into_with_pydantic(
+    out: Dict[str, Any], position: Dict[str, Any]
+) -> None:
+    """Bind the Pydantic backend on first use, then validate position into out."""
+    _bind_backend(_pydantic_backend())
+    _validate_planet_position_into(out, position)
 
-        layer_id: str = Field(..., description="Layer identifier")
-        kind: str = Field(..., description="Layer kind (e.g., 'natal', 'transit')")
-        datetime: datetime = Field(..., description="UTC datetime for calculation")
-        location: Optional[GeoLocationModel] = Field(
-            None, description="Geographic location"
-        )
-        settings: EphemerisSettingsModel = Field(..., description="Ephemeris settings")
 
-        class Config:
-            extra = "forbid"
+if MSGSPEC_AVAILABLE:
+    _bind_backend(validation_msgspec)
+else:
+    _validate = _validate_with_pydantic
+    _validate_json = _validate_json_with_pydantic
+    _validate_planet_position_into = _validate_planet_position_into_with_pydantic
 
 
 def validate_ephemeris_settings(settings: Dict[str, Any]) -> EphemerisSettings:
     """
-    Validate and normalize EphemerisSettings using Pydantic.
+    Validate and normalize EphemerisSettings using msgspec or Pydantic.
 
     Args:
         settings: Dictionary with ephemeris settings
@@ -152,36 +141,77 @@ def validate_ephemeris_settings(settings: Dict[str, Any]) -> EphemerisSettings:
         Validated EphemerisSettings dict
 
     Raises:
-        ImportError: If Pydantic is not installed
+        ImportError: If neither msgspec nor Pydantic is installed
         ValidationError: If settings are invalid
     """
-    _check_pydantic()
-    model = EphemerisSettingsModel(**settings)
-    return model.model_dump(exclude_none=False)
+    result: EphemerisSettings = _validate("settings", settings)
+    return result
 
 
 def validate_geo_location(location: Dict[str, Any]) -> GeoLocation:
     """
-    Validate and normalize GeoLocation using Pydantic.
+    Validate and normalize GeoLocation.
+
+    A two-field range check is cheaper in plain Python than a call into either
+    backend, so this works without msgspec or Pydantic installed.
 
     Args:
         location: Dictionary with lat and lon
 
     Returns:
-        Validated GeoLocation dict
+        Validated GeoLocation dict with float coordinates
 
     Raises:
-        ImportError: If Pydantic is not installed
-        ValidationError: If location is invalid
+        ValueError: If location is invalid
     """
-    _check_pydantic()
-    model = GeoLocationModel(**location)
-    return model.model_dump(exclude_none=False)
+    if location.keys() != _GEO_LOCATION_KEYS:
+        raise ValueError(
+            f"location must have exactly the keys 'lat' and 'lon', got {list(location)}"
+        )
+    # bool is an int subclass that float() accepts; both backends reject it
+    if isinstance(location["lat"], bool) or isinstance(location["lon"], bool):
+        raise ValueError(
+            f"lat and lon must be numbers, got {location['lat']!r} and {location['lon']!r}"
+        )
+    try:
+        lat = float(location["lat"])
+        lon = float(location["lon"])
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(
+            f"lat and lon must be numbers, got {location['lat']!r} and {location['lon']!r}"
+        ) from None
+    # Chained comparisons are also False for NaN, so NaN is rejected
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+        raise ValueError(f"lat must be in [-90, 90] and lon in [-180, 180], got {lat}, {lon}")
+    return {"lat": lat, "lon": lon}
+
+
+def validate_planets(planets: Dict[str, Any]) -> Dict[str, PlanetPosition]:
+    """
+    Validate and normalize a planet ID -> PlanetPosition dict using msgspec or Pydantic.
+
+    The whole dict is validated in one backend call, like the planets of
+    validate_layer_positions(). Planet IDs are interned with sys.intern, so
+    later lookups by ID hash and compare like string literals.
+
+    Args:
+        planets: Dictionary mapping planet IDs to planet position data
+
+    Returns:
+        Validated dict of PlanetPosition dicts
+
+    Raises:
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValidationError: If any planet position is invalid
+    """
+    return _intern_planet_ids(_validate("planets", planets))
 
 
 def validate_layer_positions(positions: Dict[str, Any]) -> LayerPositions:
     """
-    Validate and normalize LayerPositions using Pydantic.
+    Validate and normalize LayerPositions using msgspec or Pydantic.
+
+    Planet IDs are interned with sys.intern, as in validate_planets().
 
     Args:
         positions: Dictionary with planets and optionally houses
@@ -190,17 +220,17 @@ def validate_layer_positions(positions: Dict[str, Any]) -> LayerPositions:
         Validated LayerPositions dict
 
     Raises:
-        ImportError: If Pydantic is not installed
+        ImportError: If neither msgspec nor Pydantic is installed
         ValidationError: If positions are invalid
     """
-    _check_pydantic()
-    model = LayerPositionsModel(**positions)
-    return model.model_dump(exclude_none=False)
+    result: LayerPositions = _validate("layer_positions", positions)
+    result["planets"] = _intern_planet_ids(result["planets"])
+    return result
 
 
 def validate_layer_context(context: Dict[str, Any]) -> LayerContext:
     """
-    Validate and normalize LayerContext using Pydantic.
+    Validate and normalize LayerContext using msgspec or Pydantic.
 
     Args:
         context: Dictionary with layer context
@@ -209,17 +239,18 @@ def validate_layer_context(context: Dict[str, Any]) -> LayerContext:
         Validated LayerContext dict
 
     Raises:
-        ImportError: If Pydantic is not installed
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValueError: If context has unknown fields
         ValidationError: If context is invalid
     """
-    _check_pydantic()
-    model = LayerContextModel(**context)
-    return model.model_dump(exclude_none=False)
+    _check_layer_context_keys(context)
+    result: LayerContext = _validate("layer_context", context)
+    return result
 
 
 def validate_planet_position(position: Dict[str, Any]) -> PlanetPosition:
     """
-    Validate and normalize PlanetPosition using Pydantic.
+    Validate and normalize PlanetPosition using msgspec or Pydantic.
 
     Args:
         position: Dictionary with planet position data
@@ -228,17 +259,42 @@ def validate_planet_position(position: Dict[str, Any]) -> PlanetPosition:
         Validated PlanetPosition dict
 
     Raises:
-        ImportError: If Pydantic is not installed
+        ImportError: If neither msgspec nor Pydantic is installed
         ValidationError: If position is invalid
     """
-    _check_pydantic()
-    model = PlanetPositionModel(**position)
-    return model.model_dump(exclude_none=False)
+    result: PlanetPosition = _validate("planet_position", position)
+    return result
+
+
+def validate_planet_position_into(out: Dict[str, Any], position: Dict[str, Any]) -> None:
+    """
+    Validate PlanetPosition and write the result into an existing dict.
+
+    For tight loops, such as validating one planet per day over a year, reuse
+    one out dict instead of allocating a result dict per call. The lon, lat,
+    speed_lon and retrograde entries of out are overwritten; out is left
+    unchanged if position is invalid.
+
+    Args:
+        out: Dictionary to write the validated PlanetPosition fields into
+        position: Dictionary with planet position data
+
+    Raises:
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValidationError: If position is invalid
+
+    Example:
+        >>> scratch = {}
+        >>> for position in daily_positions:
+        ...     validate_planet_position_into(scratch, position)
+        ...     process(scratch)
+    """
+    _validate_planet_position_into(out, position)
 
 
 def validate_house_positions(houses: Dict[str, Any]) -> HousePositions:
     """
-    Validate and normalize HousePositions using Pydantic.
+    Validate and normalize HousePositions using msgspec or Pydantic.
 
     Args:
         houses: Dictionary with house positions
@@ -247,10 +303,133 @@ def validate_house_positions(houses: Dict[str, Any]) -> HousePositions:
         Validated HousePositions dict
 
     Raises:
-        ImportError: If Pydantic is not installed
+        ImportError: If neither msgspec nor Pydantic is installed
         ValidationError: If houses are invalid
     """
-    _check_pydantic()
-    model = HousePositionsModel(**houses)
-    return model.model_dump(exclude_none=False)
+    result: HousePositions = _validate("house_positions", houses)
+    return result
+
+
+def validate_ephemeris_settings_json(settings: Dict[str, Any]) -> bytes:
+    """
+    Validate EphemerisSettings and serialize it to JSON in one step.
+
+    Args:
+        settings: Dictionary with ephemeris settings
+
+    Returns:
+        Validated EphemerisSettings as UTF-8 encoded JSON
+
+    Raises:
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValidationError: If settings are invalid
+    """
+    return _validate_json("settings", settings)
+
+
+def validate_geo_location_json(location: Dict[str, Any]) -> bytes:
+    """
+    Validate GeoLocation and serialize it to JSON in one step.
+
+    Args:
+        location: Dictionary with lat and lon
 
+    Returns:
+        Validated GeoLocation as UTF-8 encoded JSON
+
+    Raises:
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValidationError: If location is invalid
+    """
+    return _validate_json("geo_location", location)
+
+
+def validate_layer_positions_json(positions: Dict[str, Any]) -> bytes:
+    """
+    Validate LayerPositions and serialize it to JSON in one step.
+
+    Args:
+        positions: Dictionary with planets and optionally houses
+
+    Returns:
+        Validated LayerPositions as UTF-8 encoded JSON
+
+    Raises:
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValidationError: If positions are invalid
+    """
+    return _validate_json("layer_positions", positions)
+
+
+def validate_layer_context_json(context: Dict[str, Any]) -> bytes:
+    """
+    Validate LayerContext and serialize it to JSON in one step.
+
+    The datetime is serialized as an ISO 8601 string. Use this instead of
+    json.dumps() on the result of validate_layer_context() when the validated
+    context is sent straight back over the network.
+
+    Args:
+        context: Dictionary with layer context
+
+    Returns:
+        Validated LayerContext as UTF-8 encoded JSON
+
+    Raises:
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValueError: If context has unknown fields
+        ValidationError: If context is invalid
+    """
+    _check_layer_context_keys(context)
+    return _validate_json("layer_context", context)
+
+
+def validate_planet_position_json(position: Dict[str, Any]) -> bytes:
+    """
+    Validate PlanetPosition and serialize it to JSON in one step.
+
+    Args:
+        position: Dictionary with planet position data
+
+    Returns:
+        Validated PlanetPosition as UTF-8 encoded JSON
+
+    Raises:
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValidationError: If position is invalid
+    """
+    return _validate_json("planet_position", position)
+
+
+def validate_planets_json(planets: Dict[str, Any]) -> bytes:
+    """
+    Validate a planet ID -> PlanetPosition dict and serialize it to JSON in one step.
+
+    Args:
+        planets: Dictionary mapping planet IDs to planet position data
+
+    Returns:
+        Validated dict of PlanetPosition dicts as UTF-8 encoded JSON
+
+    Raises:
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValidationError: If any planet position is invalid
+    """
+    return _validate_json("planets", planets)
+
+
+def validate_house_positions_json(houses: Dict[str, Any]) -> bytes:
+    """
+    Validate HousePositions and serialize it to JSON in one step.
+
+    Args:
+        houses: Dictionary with house positions
+
+    Returns:
+        Validated HousePositions as UTF-8 encoded JSON
+
+    Raises:
+        ImportError: If neither msgspec nor Pydantic is installed
+        ValidationError: If houses are invalid
+    """
+    return _validate_json("house_positions", houses)
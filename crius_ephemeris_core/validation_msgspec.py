@@ -0,0 +1,185 @@
+"""
+Runtime validation backend using msgspec (optional dependency).
+
+This module mirrors the Pydantic models in ``validation`` with msgspec
+Structs. msgspec only validates and converts, which is all the validate_*
+functions need, and does so considerably faster than Pydantic. The functions
+in ``crius_ephemeris_core.validation`` use this backend automatically when
+msgspec is installed; importing this module without msgspec raises ImportError.
+
+To use this backend, install msgspec:
+    pip install msgspec
+
+Or install with msgspec support:
+    pip install crius-ephemeris-core[msgspec]
+"""
+
+from typing import Annotated, Optional, List, Literal, Dict, Any, Union
+from datetime import datetime as DateTime
+
+import msgspec
+from msgspec import UNSET, Meta, Struct, UnsetType
+from msgspec.structs import asdict
+
+
+class VedicOptionsStruct(Struct, forbid_unknown_fields=True, kw_only=True):
+    """msgspec Struct for VedicOptions."""
+
+    include_nakshatras: Optional[bool] = None
+    enabled_vargas: Optional[List[str]] = None
+    include_dashas: Optional[bool] = None
+    dasha_systems: Optional[List[str]] = None
+    dashas_depth: Optional[Literal["mahadasha", "antardasha", "pratyantardasha"]] = None
+    include_yogas: Optional[bool] = None
+
+
+class EphemerisSettingsStruct(Struct, forbid_unknown_fields=True, kw_only=True):
+    """msgspec Struct for EphemerisSettings."""
+
+    zodiac_type: Literal["tropical", "sidereal"]
+    ayanamsa: Optional[str] = None
+    house_system: str
+    include_objects: List[str]
+    vedic_options: Optional[VedicOptionsStruct] = None
+
+
+class GeoLocationStruct(Struct, forbid_unknown_fields=True):
+    """msgspec Struct for GeoLocation."""
+
+    lat: Annotated[float, Meta(ge=-90, le=90)]
+    lon: Annotated[float, Meta(ge=-180, le=180)]
+
+
+class PlanetPositionStruct(Struct, forbid_unknown_fields=True):
+    """msgspec Struct for PlanetPosition."""
+
+    lon: Annotated[float, Meta(ge=0, lt=360)]
+    lat: float
+    speed_lon: float
+    retrograde: bool
+
+
+class HouseAnglesStruct(Struct, forbid_unknown_fields=True):
+    """msgspec Struct for HouseAngles."""
+
+    # UNSET angles are left out when converting back, like missing TypedDict keys
+    asc: Union[float, UnsetType] = UNSET
+    mc: Union[float, UnsetType] = UNSET
+    ic: Union[float, UnsetType] = UNSET
+    dc: Union[float, UnsetType] = UNSET
+
+
+class HousePositionsStruct(Struct, forbid_unknown_fields=True):
+    """msgspec Struct for HousePositions."""
+
+    system: str
+    cusps: Dict[str, float]
+    angles: HouseAnglesStruct
+
+
+class LayerPositionsStruct(Struct, forbid_unknown_fields=True, kw_only=True):
+    """msgspec Struct for LayerPositions."""
+
+    planets: Dict[str, PlanetPositionStruct]
+    houses: Optional[HousePositionsStruct] = None
+
+
+class LayerContextStruct(Struct, forbid_unknown_fields=True, kw_only=True):
+    """msgspec Struct for LayerContext."""
+
+    layer_id: str
+    kind: str
+    datetime: DateTime
+    location: Optional[GeoLocationStruct] = None
+    settings: EphemerisSettingsStruct
+
+
+# Validation kind -> Struct (or dict of Structs), shared with the dispatch in
+# ``validation``
+STRUCTS = {
+    "settings": EphemerisSettingsStruct,
+    "geo_location": GeoLocationStruct,
+    "planet_position": PlanetPositionStruct,
+    "planets": Dict[str, PlanetPositionStruct],
+    "house_positions": HousePositionsStruct,
+    "layer_positions": LayerPositionsStruct,
+    "layer_context": LayerContextStruct,
+}
+
+
+def _to_builtins(struct: Any) -> Any:
+    """Recursively convert a validated Struct to builtin dicts, keeping datetimes."""
+    return msgspec.to_builtins(struct, builtin_types=(DateTime,))
+
+
+# Validation kind -> dump. Flat Structs dump with structs.asdict, which reads
+# the class's precomputed __struct_fields__ tuple instead of walking the value
+# recursively like to_builtins; nested Structs need the recursive walk.
+_DUMPS = {
+    "settings": _to_builtins,
+    "geo_location": asdict,
+    "planet_position": asdict,
+    "planets": _to_builtins,
+    "house_positions": _to_builtins,
+    "layer_positions": _to_builtins,
+    "layer_context": _to_builtins,
+}
+
+
+def validate(kind: str, data: Dict[str, Any]) -> Any:
+    """
+    Validate data against the Struct for kind and convert back to builtin dicts.
+
+    Args:
+        kind: Key into STRUCTS
+        data: Dictionary to validate
+
+    Returns:
+        Validated dict
+
+    Raises:
+        KeyError: If kind is unknown
+        msgspec.ValidationError: If data is invalid
+    """
+    # strict=False accepts numeric strings etc., matching Pydantic's lax mode
+    struct: Any = msgspec.convert(data, STRUCTS[kind], strict=False)
+    return _DUMPS[kind](struct)
+
+
+def validate_json(kind: str, data: Dict[str, Any]) -> bytes:
+    """
+    Validate data against the Struct for kind and serialize it to JSON.
+
+    Args:
+        kind: Key into STRUCTS
+        data: Dictionary to validate
+
+    Returns:
+        Validated data as UTF-8 encoded JSON
+
+    Raises:
+        KeyError: If kind is unknown
+        msgspec.ValidationError: If data is invalid
+    """
+    return msgspec.json.encode(msgspec.convert(data, STRUCTS[kind], strict=False))
+
+
+def validate_planet_position_into(out: Dict[str, Any], position: Dict[str, Any]) -> None:
+    """
+    Validate a planet position and write its fields into out.
+
+    The fields are copied straight off the Struct, without converting it to
+    an intermediate dict.
+
+    Args:
+        out: Dictionary to write the validated fields into
+        position: Dictionary with planet position data
+
+    Raises:
+        msgspec.ValidationError: If position is invalid
+    """
+    struct = msgspec.convert(position, PlanetPositionStruct, strict=False)
+    out["lon"] = struct.lon
+    out["lat"] = struct.lat
+    out["speed_lon"] = struct.speed_lon
+    out["retrograde"] = struct.retrograde
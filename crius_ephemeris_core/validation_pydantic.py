@@ -0,0 +1,237 @@
+"""
+Runtime validation backend using Pydantic (optional dependency).
+
+This module holds the Pydantic models behind ``validation``. It is imported on
+the first validate_* call that needs it rather than with ``validation``, so
+code that never validates does not pay for importing Pydantic; importing this
+module without Pydantic raises ImportError.
+"""
+
+from typing import Optional, List, Literal, Dict, Any, Callable, Tuple
+from datetime import datetime as DateTime
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import TypedDict
+
+
+# defer_build postpones building each model's validator from import time
+# to its first validation
+_MODEL_CONFIG = ConfigDict(extra="forbid", defer_build=True)
+
+
+class VedicOptionsModel(BaseModel):
+    """Pydantic model for VedicOptions."""
+
+    model_config = _MODEL_CONFIG
+
+    include_nakshatras: Optional[bool] = None
+    enabled_vargas: Optional[List[str]] = None
+    include_dashas: Optional[bool] = None
+    dasha_systems: Optional[List[str]] = None
+    dashas_depth: Optional[Literal["mahadasha", "antardasha", "pratyantardasha"]] = None
+    include_yogas: Optional[bool] = None
+
+
+class EphemerisSettingsModel(BaseModel):
+    """Pydantic model for EphemerisSettings."""
+
+    model_config = _MODEL_CONFIG
+
+    zodiac_type: Literal["tropical", "sidereal"] = Field(
+        ..., description="Zodiac type: tropical or sidereal"
+    )
+    ayanamsa: Optional[str] = Field(
+        None, description="Ayanamsa for sidereal calculations"
+    )
+    house_system: str = Field(..., description="House system name")
+    include_objects: List[str] = Field(..., description="List of objects to include")
+    vedic_options: Optional[VedicOptionsModel] = None
+
+
+class GeoLocationModel(BaseModel):
+    """Pydantic model for GeoLocation."""
+
+    model_config = _MODEL_CONFIG
+
+    lat: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
+    lon: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
+
+
+class PlanetPositionModel(BaseModel):
+    """Pydantic model for PlanetPosition."""
+
+    model_config = _MODEL_CONFIG
+
+    lon: float = Field(..., ge=0, lt=360, description="Longitude in degrees (0-360)")
+    lat: float = Field(..., description="Latitude in degrees")
+    speed_lon: float = Field(..., description="Speed in longitude (degrees per day)")
+    retrograde: bool = Field(..., description="Whether the planet is retrograde")
+
+
+class HouseAnglesDict(TypedDict, total=False):
+    """Pydantic-validated TypedDict for HouseAngles."""
+
+    # typing_extensions.TypedDict: Pydantic rejects typing.TypedDict before 3.12.
+    # Validating a TypedDict yields a plain dict, so no dump step is needed.
+    __pydantic_config__ = _MODEL_CONFIG  # type: ignore[misc]
+
+    asc: float
+    mc: float
+    ic: float
+    dc: float
+
+
+class HousePositionsModel(BaseModel):
+    """Pydantic model for HousePositions."""
+
+    model_config = _MODEL_CONFIG
+
+    system: str = Field(..., description="House system name")
+    cusps: Dict[str, float] = Field(..., description="House cusps: '1'..'12' -> degrees")
+    angles: HouseAnglesDict = Field(..., description="Angles: 'asc', 'mc', 'ic', 'dc' -> degrees")
+
+
+class LayerPositionsModel(BaseModel):
+    """Pydantic model for LayerPositions."""
+
+    model_config = _MODEL_CONFIG
+
+    planets: Dict[str, PlanetPositionModel] = Field(
+        ..., description="Planet ID -> position"
+    )
+    houses: Optional[HousePositionsModel] = Field(
+        None, description="House positions (None if no location provided)"
+    )
+
+
+class LayerContextModel(BaseModel):
+    """Pydantic model for LayerContext."""
+
+    model_config = _MODEL_CONFIG
+
+    layer_id: str = Field(..., description="Layer identifier")
+    kind: str = Field(..., description="Layer kind (e.g., 'natal', 'transit')")
+    # DateTime alias: a field named "datetime" would shadow the datetime type
+    datetime: DateTime = Field(..., description="UTC datetime for calculation")
+    location: Optional[GeoLocationModel] = Field(
+        None, description="Geographic location"
+    )
+    settings: EphemerisSettingsModel = Field(..., description="Ephemeris settings")
+
+
+# The dump helpers read validated values straight from each model's
+# __dict__ instead of model_dump(), which re-walks every field generically.
+# The models are discarded after dumping, so their __dict__ is returned
+# (and nested models replaced in place) without copying.
+
+
+def _dump_settings(model: EphemerisSettingsModel) -> Dict[str, Any]:
+    """Dump a validated EphemerisSettingsModel to a dict."""
+    data = model.__dict__
+    if data["vedic_options"] is not None:
+        data["vedic_options"] = data["vedic_options"].__dict__
+    return data
+
+
+def _dump_planets(planets: Dict[str, PlanetPositionModel]) -> Dict[str, Any]:
+    """Dump a dict of validated PlanetPositionModels to a dict of dicts."""
+    return {planet_id: position.__dict__ for planet_id, position in planets.items()}
+
+
+def _dump_layer_positions(model: LayerPositionsModel) -> Dict[str, Any]:
+    """Dump a validated LayerPositionsModel to a dict."""
+    data = model.__dict__
+    data["planets"] = _dump_planets(data["planets"])
+    if data["houses"] is not None:
+        data["houses"] = data["houses"].__dict__
+    return data
+
+
+def _dump_layer_context(model: LayerContextModel) -> Dict[str, Any]:
+    """Dump a validated LayerContextModel to a dict."""
+    data = model.__dict__
+    if data["location"] is not None:
+        data["location"] = data["location"].__dict__
+    data["settings"] = _dump_settings(data["settings"])
+    return data
+
+
+# Validates a whole planet ID -> position dict in one call; defer_build keeps
+# the adapter from building PlanetPositionModel's schema at import
+_PLANETS_ADAPTER = TypeAdapter(
+    Dict[str, PlanetPositionModel], config=ConfigDict(defer_build=True)
+)
+
+# Validation kind -> (model_validate, dump) pairs, shared with the dispatch in
+# ``validation``. model_validate hands the input dict straight to the model's
+# validator. Flat models dump with vars(), which returns the model's __dict__.
+VALIDATORS: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Dict[str, Any]]]] = {
+    "settings": (EphemerisSettingsModel.model_validate, _dump_settings),
+    "geo_location": (GeoLocationModel.model_validate, vars),
+    "planet_position": (PlanetPositionModel.model_validate, vars),
+    "planets": (_PLANETS_ADAPTER.validate_python, _dump_planets),
+    "house_positions": (HousePositionsModel.model_validate, vars),
+    "layer_positions": (
+        LayerPositionsModel.model_validate,
+        _dump_layer_positions,
+    ),
+    "layer_context": (LayerContextModel.model_validate, _dump_layer_context),
+}
+
+
+def validate(kind: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate data against the model for kind and dump it to a dict.
+
+    Args:
+        kind: Key into VALIDATORS
+        data: Dictionary to validate
+
+    Returns:
+        Validated dict
+
+    Raises:
+        KeyError: If kind is unknown
+        pydantic.ValidationError: If data is invalid
+    """
+    model_validate, dump = VALIDATORS[kind]
+    return dump(model_validate(data))
+
+
+def validate_json(kind: str, data: Dict[str, Any]) -> bytes:
+    """
+    Validate data against the model for kind and serialize it to JSON.
+
+    Serialization runs in pydantic-core, without building an intermediate dict.
+
+    Args:
+        kind: Key into VALIDATORS
+        data: Dictionary to validate
+
+    Returns:
+        Validated data as UTF-8 encoded JSON
+
+    Raises:
+        KeyError: If kind is unknown
+        pydantic.ValidationError: If data is invalid
+    """
+    model_validate, _ = VALIDATORS[kind]
+    if kind == "planets":
+        # The planets dict is not a model; the adapter serializes it instead
+        return _PLANETS_ADAPTER.dump_json(model_validate(data))
+    model: BaseModel = model_validate(data)
+    return model.model_dump_json().encode()
+
+
+def validate_planet_position_into(out: Dict[str, Any], position: Dict[str, Any]) -> None:
+    """
+    Validate a planet position and write its fields into out.
+
+    Args:
+        out: Dictionary to write the validated fields into
+        position: Dictionary with planet position data
+
+    Raises:
+        pydantic.ValidationError: If position is invalid
+    """
+    out.update(PlanetPositionModel.model_validate(position).__dict__)
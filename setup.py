@@ -1,6 +1,24 @@
-"""Setup script for crius-ephemeris-core (fallback for older pip)."""
+"""Setup script for crius-ephemeris-core (fallback for older pip).
+
+Setting CRIUS_USE_MYPYC=1 compiles crius_ephemeris_core/validation.py to a C
+extension with mypyc. mypy must be installed in the build environment:
+
+    pip install mypy
+    CRIUS_USE_MYPYC=1 pip install --no-build-isolation .
+
+Without the variable the package is built as pure Python.
+"""
+
+import os
 
 from setuptools import setup
 
-setup()
+ext_modules = []
+if os.environ.get("CRIUS_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Only validation.py is compiled; errors in the modules it imports are
+    # not reported, since they run uncompiled
+    ext_modules = mypycify(["--follow-imports=silent", "crius_ephemeris_core/validation.py"])
 
+setup(ext_modules=ext_modules)
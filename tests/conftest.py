@@ -0,0 +1,15 @@
+"""Shared test fixtures."""
+
+import tomllib
+from pathlib import Path
+
+import pytest
+
+PYPROJECT = Path(__file__).resolve().parent.parent / "pyproject.toml"
+
+
+@pytest.fixture(scope="session")
+def pyproject_version():
+    """Project version from pyproject.toml, read once per test session."""
+    with PYPROJECT.open("rb") as f:
+        return tomllib.load(f)["project"]["version"]
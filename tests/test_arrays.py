@@ -0,0 +1,135 @@
+"""Tests for NumPy array representations."""
+
+import pytest
+
+from crius_ephemeris_core import LayerPositions
+
+np = pytest.importorskip("numpy")
+
+from crius_ephemeris_core.arrays import (
+    ANGLE_INDEX,
+    CUSP_INDEX,
+    PLANET_DTYPE,
+    from_dict,
+    houses_from_dict,
+    houses_to_dict,
+    soa_from_dict,
+    soa_to_dict,
+    to_dict,
+)
+
+
+POSITIONS: LayerPositions = {
+    "planets": {
+        "sun": {"lon": 280.5, "lat": 0.0, "speed_lon": 1.0, "retrograde": False},
+        "mercury": {"lon": 265.0, "lat": -1.5, "speed_lon": -0.4, "retrograde": True},
+    },
+    "houses": None,
+}
+
+
+class TestLayerPositionsArray:
+    """Test LayerPositions <-> LayerPositionsArray conversion."""
+
+    def test_from_dict(self):
+        """Test that planets become one structured array row each."""
+        arr = from_dict(POSITIONS)
+
+        assert arr["planet_ids"] == ("sun", "mercury")
+        assert arr["planets"].dtype == PLANET_DTYPE
+        assert arr["planets"].shape == (2,)
+        np.testing.assert_array_equal(arr["planets"]["lon"], [280.5, 265.0])
+        np.testing.assert_array_equal(arr["planets"]["retrograde"], [False, True])
+        assert arr["houses"] is None
+
+    def test_round_trip(self):
+        """Test that converting back yields the original dict."""
+        result = to_dict(from_dict(POSITIONS))
+
+        assert result == POSITIONS
+        assert type(result["planets"]["sun"]["lon"]) is float
+        assert type(result["planets"]["sun"]["retrograde"]) is bool
+
+    def test_empty_planets(self):
+        """Test conversion with no planets."""
+        arr = from_dict({"planets": {}, "houses": None})
+
+        assert arr["planets"].shape == (0,)
+        assert to_dict(arr) == {"planets": {}, "houses": None}
+
+
+class TestLayerPositionsSoA:
+    """Test LayerPositions <-> LayerPositionsSoA conversion."""
+
+    def test_soa_from_dict(self):
+        """Test that each planet field becomes its own contiguous column."""
+        soa = soa_from_dict(POSITIONS)
+
+        assert soa["planet_ids"] == ("sun", "mercury")
+        np.testing.assert_array_equal(soa["lon"], [280.5, 265.0])
+        np.testing.assert_array_equal(soa["speed_lon"], [1.0, -0.4])
+        np.testing.assert_array_equal(soa["retrograde"], [False, True])
+        assert soa["retrograde"].dtype == np.bool_
+        for field in ("lon", "lat", "speed_lon", "retrograde"):
+            assert soa[field].flags["C_CONTIGUOUS"]
+        assert soa["houses"] is None
+
+    def test_round_trip(self):
+        """Test that converting back yields the original dict, houses included."""
+        houses = {
+            "system": "placidus",
+            "cusps": {str(i): (i - 1) * 30.0 for i in range(1, 13)},
+            "angles": {"asc": 15.0, "mc": 105.0, "ic": 285.0, "dc": 195.0},
+        }
+        positions = {**POSITIONS, "houses": houses}
+        result = soa_to_dict(soa_from_dict(positions))
+
+        assert result == positions
+        assert type(result["planets"]["sun"]["retrograde"]) is bool
+
+    def test_empty_planets(self):
+        """Test conversion with no planets."""
+        soa = soa_from_dict({"planets": {}, "houses": None})
+
+        assert soa["lon"].shape == (0,)
+        assert soa_to_dict(soa) == {"planets": {}, "houses": None}
+
+
+class TestHousePositionsArray:
+    """Test HousePositions <-> HousePositionsArray conversion."""
+
+    HOUSES = {
+        "system": "placidus",
+        "cusps": {str(i): (i - 1) * 30.0 + 15.0 for i in range(1, 13)},
+        "angles": {"asc": 15.0, "mc": 105.0, "ic": 285.0, "dc": 195.0},
+    }
+
+    def test_fixed_length_arrays(self):
+        """Test that cusps and angles land at their fixed indices."""
+        arr = houses_from_dict(self.HOUSES)
+
+        assert arr["cusps"].shape == (12,) and arr["cusps"].dtype == np.float64
+        assert arr["cusps"][CUSP_INDEX["1"]] == 15.0
+        assert arr["cusps"][CUSP_INDEX["12"]] == 345.0
+        np.testing.assert_array_equal(arr["angles"], [15.0, 105.0, 285.0, 195.0])
+        assert arr["angles"][ANGLE_INDEX["mc"]] == 105.0
+
+    def test_round_trip(self):
+        """Test that complete houses convert back unchanged."""
+        assert houses_to_dict(houses_from_dict(self.HOUSES)) == self.HOUSES
+
+    def test_partial_houses(self):
+        """Test that missing cusps are NaN and dropped again on the way back."""
+        houses = {"system": "placidus", "cusps": {"1": 15.0, "2": 45.0}, "angles": {}}
+        arr = houses_from_dict(houses)
+
+        assert np.isnan(arr["cusps"][2:]).all()
+        assert houses_to_dict(arr) == houses
+
+    def test_layer_positions_with_houses(self):
+        """Test that LayerPositions conversion includes houses."""
+        positions = {**POSITIONS, "houses": self.HOUSES}
+        arr = from_dict(positions)
+
+        assert arr["houses"]["cusps"].shape == (12,)
+        assert to_dict(arr) == positions
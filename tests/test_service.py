@@ -0,0 +1,473 @@
+"""Service layer tests."""
+
+import subprocess
+import sys
+
+import pytest
+from datetime import datetime, timedelta
+
+from crius_ephemeris_core import (
+    BaseEphemerisService,
+    CachedEphemerisService,
+    EphemerisService,
+    EphemerisSettings,
+    LayerPositions,
+    LRUCacheProvider,
+    MemoizedEphemerisService,
+    TieredCacheProvider,
+    normalize_settings,
+)
+from crius_ephemeris_core.testing import MockEphemerisAdapter
+
+
+SETTINGS: EphemerisSettings = {
+    "zodiac_type": "tropical",
+    "ayanamsa": None,
+    "house_system": "placidus",
+    "include_objects": ["sun", "moon"],
+}
+
+POSITIONS: LayerPositions = {
+    "planets": {
+        "sun": {"lon": 280.5, "lat": 0.0, "speed_lon": 1.0, "retrograde": False},
+        "moon": {"lon": 45.2, "lat": 2.1, "speed_lon": 13.0, "retrograde": False},
+    },
+    "houses": None,
+}
+
+
+class DictCache:
+    """Minimal dict-backed CacheProvider."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def clear(self):
+        self.data.clear()
+
+
+class TestLRUCacheProvider:
+    """Test LRUCacheProvider."""
+
+    def test_get_and_set(self):
+        """Test that values are stored by reference."""
+        cache = LRUCacheProvider()
+        cache.set("a", POSITIONS)
+        assert cache.get("a") is POSITIONS
+        assert cache.get("b") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = LRUCacheProvider(maxsize=2)
+        cache.set("a", POSITIONS)
+        cache.set("b", POSITIONS)
+        cache.get("a")
+        cache.set("c", POSITIONS)
+
+        assert len(cache) == 2
+        assert cache.get("a") is POSITIONS
+        assert cache.get("b") is None
+        assert cache.get("c") is POSITIONS
+
+    def test_clear(self):
+        """Test that clear removes all entries."""
+        cache = LRUCacheProvider()
+        cache.set("a", POSITIONS)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_compute_if_absent(self):
+        """Test that the factory only runs on a miss."""
+        cache = LRUCacheProvider()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return POSITIONS
+
+        assert cache.compute_if_absent("a", factory) is POSITIONS
+        assert cache.compute_if_absent("a", factory) is POSITIONS
+        assert len(calls) == 1
+
+    def test_compact_entries(self):
+        """Test that compact entries round-trip to equal dicts."""
+        cache = LRUCacheProvider(compact=True)
+        positions = {
+            **POSITIONS,
+            "houses": {
+                "system": "placidus",
+                "cusps": {str(i): i * 30.0 for i in range(1, 13)},
+                "angles": {"asc": 15.0, "mc": 105.0, "ic": 285.0, "dc": 195.0},
+            },
+        }
+        cache.set("a", positions)
+        cache.set("b", POSITIONS)
+
+        assert cache.get("a") == positions
+        assert cache.get("b") == POSITIONS
+        assert cache.compute_if_absent("b", lambda: None) == POSITIONS
+        with pytest.raises(TypeError):
+            cache.get("a")["houses"]["cusps"]["1"] = 0.0
+
+    def test_compact_hits_are_read_only(self):
+        """Test that compact hits are frozen like the results callers cached."""
+        cache = LRUCacheProvider(compact=True)
+        cache.set("a", POSITIONS)
+
+        for hit in (cache.get("a"), cache.compute_if_absent("a", lambda: None)):
+            assert hit == POSITIONS
+            with pytest.raises(TypeError):
+                hit["planets"]["sun"]["lon"] = 0.0
+
+    def test_invalid_maxsize(self):
+        """Test that maxsize must be positive."""
+        with pytest.raises(ValueError):
+            LRUCacheProvider(maxsize=0)
+
+
+class TestTieredCacheProvider:
+    """Test TieredCacheProvider."""
+
+    def test_remote_hit_backfills_local(self):
+        """Test that remote hits are copied into the local cache."""
+        local, remote = LRUCacheProvider(), DictCache()
+        remote.set("a", POSITIONS)
+        cache = TieredCacheProvider(local, remote)
+
+        assert cache.get("a") is POSITIONS
+        assert local.get("a") is POSITIONS
+        assert cache.get("b") is None
+
+    def test_compute_if_absent_fills_both_tiers(self):
+        """Test that a computed value is written to both caches."""
+        local, remote = LRUCacheProvider(), DictCache()
+        cache = TieredCacheProvider(local, remote)
+
+        assert cache.compute_if_absent("a", lambda: POSITIONS) is POSITIONS
+        assert local.get("a") is remote.get("a") is POSITIONS
+
+    def test_set_and_clear_both_tiers(self):
+        """Test that writes and clears reach both caches."""
+        local, remote = LRUCacheProvider(), DictCache()
+        cache = TieredCacheProvider(local, remote)
+
+        cache.set("a", POSITIONS)
+        assert local.get("a") is remote.get("a") is POSITIONS
+
+        cache.clear()
+        assert local.get("a") is None and remote.get("a") is None
+
+
+class TestCachedEphemerisService:
+    """Test CachedEphemerisService."""
+
+    def test_cache_hit_skips_adapter(self):
+        """Test that repeated calls are served from the cache."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = CachedEphemerisService(adapter, cache=DictCache())
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+
+        first = service.get_positions(dt, {"lat": 40.7, "lon": -74.0}, SETTINGS)
+        second = service.get_positions(dt, {"lat": 40.7, "lon": -74.0}, SETTINGS)
+
+        assert first == second == POSITIONS
+        assert second is first
+        assert adapter.call_count == 1
+
+    def test_lru_cache_provider(self):
+        """Test caching through a provider that implements compute_if_absent."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = CachedEphemerisService(adapter, cache=LRUCacheProvider())
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+
+        first = service.get_positions(dt, None, SETTINGS)
+        assert service.get_positions(dt, None, SETTINGS) is first
+        assert adapter.call_count == 1
+
+    def test_replacing_cache(self):
+        """Test that assigning a new cache provider takes effect."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = CachedEphemerisService(adapter, cache=DictCache())
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+        service.get_positions(dt, None, SETTINGS)
+
+        service.cache = LRUCacheProvider()
+        service.get_positions(dt, None, SETTINGS)
+        service.cache = None
+        service.get_positions(dt, None, SETTINGS)
+
+        assert adapter.call_count == 3
+
+    def test_cached_results_are_read_only(self):
+        """Test that callers cannot corrupt cached entries."""
+        service = CachedEphemerisService(
+            MockEphemerisAdapter(return_value=POSITIONS), cache=DictCache()
+        )
+        result = service.get_positions(datetime(2024, 1, 1), None, SETTINGS)
+
+        with pytest.raises(TypeError):
+            result["planets"]["sun"]["lon"] = 0.0
+        with pytest.raises(TypeError):
+            result["houses"] = None
+        assert POSITIONS["planets"]["sun"]["lon"] == 280.5
+
+    def test_default_cache_key(self):
+        """Test that keys ignore include_objects order but not other settings."""
+        service = CachedEphemerisService(MockEphemerisAdapter(), cache=DictCache())
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+        reordered = {**SETTINGS, "include_objects": ["moon", "sun"]}
+        sidereal = {**SETTINGS, "zodiac_type": "sidereal", "ayanamsa": "lahiri"}
+        fagan = {**sidereal, "ayanamsa": "fagan_bradley"}
+
+        key = service.cache_key_fn(dt, None, SETTINGS)
+
+        assert hash(key) == hash(service.cache_key_fn(dt, None, reordered))
+        assert key == service.cache_key_fn(dt, None, reordered)
+        assert key != service.cache_key_fn(dt, {"lat": 0.0, "lon": 0.0}, SETTINGS)
+        assert service.cache_key_fn(dt, None, sidereal) != service.cache_key_fn(
+            dt, None, fagan
+        )
+
+    def test_cache_key_uses_instant(self):
+        """Test that aware datetimes for one instant share a key."""
+        from datetime import timezone
+
+        service = CachedEphemerisService(MockEphemerisAdapter(), cache=DictCache())
+        utc = datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        aware = datetime(2024, 1, 1, 14, 0, 0, 123456, tzinfo=timezone(timedelta(hours=2)))
+
+        key = service.cache_key_fn(utc, None, SETTINGS)
+
+        assert key == service.cache_key_fn(aware, None, SETTINGS)
+        assert repr(key) == repr(service.cache_key_fn(aware, None, SETTINGS))
+        assert key != service.cache_key_fn(utc + timedelta(microseconds=1), None, SETTINGS)
+
+    def test_cache_key_matches_normalized_settings(self):
+        """Test that normalized and plain settings share cache entries."""
+        service = CachedEphemerisService(MockEphemerisAdapter(), cache=DictCache())
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+
+        assert service.cache_key_fn(dt, None, SETTINGS) == service.cache_key_fn(
+            dt, None, normalize_settings(SETTINGS)
+        )
+
+    def test_cache_key_ignores_tuple_order(self):
+        """Test that include_objects tuples in any order share a cache key."""
+        service = CachedEphemerisService(MockEphemerisAdapter(), cache=DictCache())
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+
+        assert service.cache_key_fn(
+            dt, None, {**SETTINGS, "include_objects": ("sun", "moon")}
+        ) == service.cache_key_fn(dt, None, {**SETTINGS, "include_objects": ("moon", "sun")})
+
+    def test_without_cache_calls_adapter(self):
+        """Test that a service without a cache always calls the adapter."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = CachedEphemerisService(adapter)
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+
+        service.get_positions(dt, None, SETTINGS)
+        service.get_positions(dt, None, SETTINGS)
+
+        assert adapter.call_count == 2
+
+
+class TestMemoizedEphemerisService:
+    """Test MemoizedEphemerisService."""
+
+    def test_memoizes_equal_inputs(self):
+        """Test that equal inputs hit the memo regardless of object order."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = MemoizedEphemerisService(adapter)
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+        reordered = {**SETTINGS, "include_objects": ["moon", "sun"]}
+
+        first = service.get_positions(dt, {"lat": 40.7, "lon": -74.0}, SETTINGS)
+        second = service.get_positions(dt, {"lat": 40.7, "lon": -74.0}, reordered)
+
+        assert second is first
+        assert first == POSITIONS
+        assert adapter.call_count == 1
+        assert service.cache_info().hits == 1
+        with pytest.raises(TypeError):
+            first["houses"] = None
+
+    def test_rebuilds_adapter_arguments(self):
+        """Test that the adapter receives equivalent location and settings."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = MemoizedEphemerisService(adapter)
+        settings = {**SETTINGS, "vedic_options": {"enabled_vargas": ["d9"], "include_yogas": True}}
+
+        service.get_positions(datetime(2024, 1, 1), {"lat": 1.0, "lon": 2.0}, settings)
+
+        assert adapter.last_location == {"lat": 1.0, "lon": 2.0}
+        assert adapter.last_settings["include_objects"] == ("moon", "sun")
+        assert adapter.last_settings["vedic_options"] == settings["vedic_options"]
+
+    def test_unsorted_tuple_objects(self):
+        """Test that an unsorted include_objects tuple reaches the adapter sorted."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = MemoizedEphemerisService(adapter)
+
+        service.get_positions(
+            datetime(2024, 1, 1), None, {**SETTINGS, "include_objects": ("sun", "moon")}
+        )
+
+        assert adapter.last_settings["include_objects"] == ("moon", "sun")
+
+    def test_distinct_inputs_and_clear(self):
+        """Test that different inputs miss and cache_clear empties the memo."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = MemoizedEphemerisService(adapter, maxsize=8)
+        dt = datetime(2024, 1, 1)
+
+        service.get_positions(dt, None, SETTINGS)
+        service.get_positions(dt, None, {**SETTINGS, "house_system": "whole_sign"})
+        service.cache_clear()
+        service.get_positions(dt, None, SETTINGS)
+
+        assert adapter.call_count == 3
+
+
+class TestBaseEphemerisService:
+    """Test BaseEphemerisService."""
+
+    def test_conforms_to_service_protocol(self):
+        """Test that base and cached services satisfy EphemerisService."""
+        adapter = MockEphemerisAdapter()
+        assert isinstance(BaseEphemerisService(adapter), EphemerisService)
+        assert isinstance(CachedEphemerisService(adapter), EphemerisService)
+
+    def test_get_positions_for_context(self):
+        """Test that context fields are passed through to the adapter."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = BaseEphemerisService(adapter)
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+        location = {"lat": 40.7128, "lon": -74.0060}
+
+        result = service.get_positions_for_context(
+            {
+                "layer_id": "natal",
+                "kind": "natal",
+                "datetime": dt,
+                "location": location,
+                "settings": SETTINGS,
+            }
+        )
+
+        assert result == POSITIONS
+        assert adapter.last_dt == dt
+        assert adapter.last_location == location
+        assert adapter.last_settings == SETTINGS
+
+
+class TestGetPositionsBatch:
+    """Test BaseEphemerisService.get_positions_batch."""
+
+    def test_fallback_stacks_per_datetime_results(self):
+        """Test that adapters without calc_positions_batch are called per datetime."""
+        adapter = MockEphemerisAdapter(return_value=POSITIONS)
+        service = BaseEphemerisService(adapter)
+        dts = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(3)]
+
+        batch = service.get_positions_batch(dts, None, SETTINGS)
+
+        assert adapter.call_count == 3
+        assert batch["planets"]["sun"]["lon"] == [280.5, 280.5, 280.5]
+        assert batch["planets"]["moon"]["speed_lon"] == [13.0, 13.0, 13.0]
+        assert batch["planets"]["moon"]["retrograde"] == [False, False, False]
+        assert batch["houses"] is None
+
+    def test_fallback_with_empty_input(self):
+        """Test that an empty series yields an empty batch."""
+        service = BaseEphemerisService(MockEphemerisAdapter(return_value=POSITIONS))
+
+        batch = service.get_positions_batch([], None, SETTINGS)
+
+        assert batch == {"planets": {}, "houses": None}
+
+    def test_delegates_to_batch_adapter(self):
+        """Test that calc_positions_batch is preferred when the adapter has it."""
+
+        class BatchAdapter(MockEphemerisAdapter):
+            def calc_positions_batch(self, dt_utc_array, location, settings):
+                return {"planets": {}, "houses": [None] * len(dt_utc_array)}
+
+        adapter = BatchAdapter(return_value=POSITIONS)
+        service = BaseEphemerisService(adapter)
+
+        batch = service.get_positions_batch([datetime(2024, 1, 1)] * 2, None, SETTINGS)
+
+        assert adapter.call_count == 0
+        assert batch["houses"] == [None, None]
+
+
+class TestGetPositionsMany:
+    """Test BaseEphemerisService.get_positions_many."""
+
+    def test_fallback_calls_adapter_per_pair(self):
+        """Test that each datetime/location pair is calculated, in order."""
+
+        class EchoAdapter(MockEphemerisAdapter):
+            def calc_positions(self, dt_utc, location, settings):
+                return {"planets": {}, "houses": location and {"system": str(dt_utc.day)}}
+
+        service = BaseEphemerisService(EchoAdapter())
+        dts = [datetime(2024, 1, day) for day in range(1, 6)]
+        locations = [{"lat": 0.0, "lon": float(i)} for i in range(5)]
+
+        results = service.get_positions_many(dts, locations, SETTINGS, max_workers=3)
+
+        assert [r["houses"]["system"] for r in results] == ["1", "2", "3", "4", "5"]
+
+    def test_delegates_to_parallel_adapter(self):
+        """Test that calc_positions_many is preferred when the adapter has it."""
+
+        class ManyAdapter(MockEphemerisAdapter):
+            def calc_positions_many(self, dt_utc_array, locations, settings):
+                return [self.return_value] * len(dt_utc_array)
+
+        adapter = ManyAdapter(return_value=POSITIONS)
+        results = BaseEphemerisService(adapter).get_positions_many(
+            [datetime(2024, 1, 1)] * 2, [None, None], SETTINGS
+        )
+
+        assert results == [POSITIONS, POSITIONS]
+        assert adapter.call_count == 0
+
+    def test_length_mismatch(self):
+        """Test that datetimes and locations must pair up."""
+        service = BaseEphemerisService(MockEphemerisAdapter())
+        with pytest.raises(ValueError):
+            service.get_positions_many([datetime(2024, 1, 1)], [], SETTINGS)
+
+
+class TestLazyServiceExports:
+    """Test lazy loading of service exports from the package."""
+
+    def test_package_import_does_not_load_service(self):
+        """Test that importing the package leaves the service module unloaded."""
+        code = (
+            "import sys, crius_ephemeris_core as c; "
+            "assert 'crius_ephemeris_core.service' not in sys.modules; "
+            "c.CachedEphemerisService; "
+            "assert 'crius_ephemeris_core.service' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_exports_resolve_to_service_module(self):
+        """Test that lazy exports are the service module's objects."""
+        import crius_ephemeris_core
+        from crius_ephemeris_core import service
+
+        for name in ("BaseEphemerisService", "LRUCacheProvider", "create_ephemeris_service"):
+            assert getattr(crius_ephemeris_core, name) is getattr(service, name)
+            assert name in crius_ephemeris_core.__all__
+        with pytest.raises(AttributeError):
+            crius_ephemeris_core.NoSuchService
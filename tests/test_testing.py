@@ -0,0 +1,205 @@
+"""Tests for adapter testing utilities."""
+
+import subprocess
+import sys
+
+import pytest
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from crius_ephemeris_core import (
+    BaseEphemerisService,
+    EphemerisSettings,
+    GeoLocation,
+    LayerPositions,
+)
+from crius_ephemeris_core.testing import (
+    MockEphemerisAdapter,
+    NumbaMockAdapter,
+    _cached_type_hints,
+    invalidate_validation_cache,
+    verify_adapter_protocol,
+    verify_adapter_runtime,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+requires_numpy = pytest.mark.skipif(np is None, reason="numpy not installed")
+
+
+SETTINGS: EphemerisSettings = {
+    "zodiac_type": "tropical",
+    "ayanamsa": None,
+    "house_system": "placidus",
+    "include_objects": ["sun", "moon"],
+}
+
+
+class TestVerifyAdapterProtocol:
+    """Test verify_adapter_protocol."""
+
+    def test_mock_adapter_is_conformant(self):
+        """Test that the bundled mock adapter passes the protocol check."""
+        assert verify_adapter_protocol(MockEphemerisAdapter()) == []
+
+    def test_missing_method(self):
+        """Test that adapters without calc_positions are reported."""
+        assert verify_adapter_protocol(object()) == [
+            "Adapter must have 'calc_positions' method"
+        ]
+
+    def test_reports_mismatched_annotations(self):
+        """Test that each wrong annotation and missing parameter is reported."""
+
+        class BadAdapter:
+            def calc_positions(self, dt_utc: str, location: dict, config: dict) -> dict:
+                ...
+
+        assert verify_adapter_protocol(BadAdapter()) == [
+            "calc_positions must have 'settings' parameter",
+            "calc_positions 'dt_utc' parameter must be datetime, got <class 'str'>",
+            "calc_positions 'location' parameter must be Optional[GeoLocation], "
+            "got <class 'dict'>",
+            "calc_positions must return LayerPositions, got <class 'dict'>",
+        ]
+
+    def test_validated_classes_short_circuit(self):
+        """Test that a conformant class is only inspected once."""
+        invalidate_validation_cache()
+        verify_adapter_protocol(MockEphemerisAdapter())
+        misses = _cached_type_hints.cache_info().misses
+
+        assert verify_adapter_protocol(MockEphemerisAdapter()) == []
+        assert _cached_type_hints.cache_info().misses == misses
+
+    def test_invalidate_validation_cache(self):
+        """Test that invalidation forces a full check again."""
+        verify_adapter_protocol(MockEphemerisAdapter())
+        invalidate_validation_cache()
+
+        assert verify_adapter_protocol(MockEphemerisAdapter()) == []
+        assert _cached_type_hints.cache_info().misses == 1
+
+    def test_nonconformant_class_is_rechecked(self):
+        """Test that classes with errors are not remembered."""
+
+        class BadAdapter:
+            def calc_positions(self, dt_utc: str, location, settings):
+                ...
+
+        assert len(verify_adapter_protocol(BadAdapter())) == 1
+        assert len(verify_adapter_protocol(BadAdapter())) == 1
+
+    def test_unhashable_calc_positions(self):
+        """Test that an unhashable callable calc_positions is still inspected."""
+
+        @dataclass
+        class Calculator:
+            positions: LayerPositions
+
+            def __call__(
+                self,
+                dt_utc: datetime,
+                location: Optional[GeoLocation],
+                settings: EphemerisSettings,
+            ) -> LayerPositions:
+                return self.positions
+
+        class CallableAdapter:
+            def __init__(self):
+                self.calc_positions = Calculator({"planets": {}, "houses": None})
+
+        assert verify_adapter_protocol(CallableAdapter()) == []
+
+
+class TestVerifyAdapterRuntime:
+    """Test verify_adapter_runtime."""
+
+    def test_valid_result(self):
+        """Test that a complete result has no errors."""
+        adapter = MockEphemerisAdapter(
+            return_value={
+                "planets": {
+                    "sun": {"lon": 280.5, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}
+                },
+                "houses": {"system": "placidus", "cusps": {}, "angles": {}},
+            }
+        )
+        assert verify_adapter_runtime(adapter) == []
+
+    def test_missing_fields(self):
+        """Test that each missing planet and house field is reported."""
+        adapter = MockEphemerisAdapter(
+            return_value={
+                "planets": {"sun": {"lon": 280.5, "lat": 0.0}},
+                "houses": {"system": "placidus"},
+            }
+        )
+        assert verify_adapter_runtime(adapter) == [
+            "Planet position must have 'retrograde' field",
+            "Planet position must have 'speed_lon' field",
+            "House positions must have 'angles' field",
+            "House positions must have 'cusps' field",
+        ]
+
+
+@requires_numpy
+class TestNumbaMockAdapter:
+    """Test NumbaMockAdapter."""
+
+    def test_conforms_to_protocol(self):
+        """Test that the numeric mock passes protocol and runtime checks."""
+        adapter = NumbaMockAdapter()
+        assert verify_adapter_protocol(adapter) == []
+        assert verify_adapter_runtime(adapter, settings=SETTINGS) == []
+
+    def test_calc_positions(self):
+        """Test positions at J2000 and one day later."""
+        adapter = NumbaMockAdapter({"sun": (280.0, 1.0), "pluto": (10.0, -0.5)})
+        settings = {**SETTINGS, "include_objects": ["sun", "pluto"]}
+
+        result = adapter.calc_positions(datetime(2000, 1, 2, 12, 0, 0), None, settings)
+
+        assert result["planets"]["sun"] == {
+            "lon": 281.0,
+            "lat": 0.0,
+            "speed_lon": 1.0,
+            "retrograde": False,
+        }
+        assert result["planets"]["pluto"]["lon"] == 9.5
+        assert result["planets"]["pluto"]["retrograde"] is True
+        assert result["houses"] is None
+
+    def test_include_objects_filters_planets(self):
+        """Test that only requested planets are returned."""
+        result = NumbaMockAdapter().calc_positions(datetime(2024, 1, 1), None, SETTINGS)
+        assert set(result["planets"]) == {"sun", "moon"}
+
+    def test_import_does_not_load_numpy(self):
+        """Test that NumPy is only imported when a NumbaMockAdapter is created."""
+        code = (
+            "import sys; from crius_ephemeris_core import testing; "
+            "assert 'numpy' not in sys.modules and 'numba' not in sys.modules; "
+            "testing.NumbaMockAdapter(); "
+            "assert 'numpy' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_batch_matches_single_calls(self):
+        """Test that batch results match per-datetime results for both input kinds."""
+        adapter = NumbaMockAdapter()
+        dts = [datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(hours=6 * i) for i in range(4)]
+        dt64 = np.array([dt.replace(tzinfo=None) for dt in dts], dtype="datetime64[ns]")
+
+        for series in (dts, dt64):
+            batch = BaseEphemerisService(adapter).get_positions_batch(series, None, SETTINGS)
+            for i, dt in enumerate(dts):
+                single = adapter.calc_positions(dt, None, SETTINGS)
+                for planet_id, position in single["planets"].items():
+                    column = batch["planets"][planet_id]
+                    assert column["lon"][i] == pytest.approx(position["lon"])
+                    assert column["speed_lon"][i] == position["speed_lon"]
@@ -12,6 +12,10 @@ from crius_ephemeris_core import (
     LayerPositions,
     LayerContext,
     VedicOptions,
+    ZodiacType,
+    DashaDepth,
+    freeze_layer_positions,
+    normalize_settings,
 )
 
 
@@ -73,6 +77,43 @@ class TestEphemerisSettings:
         assert settings_with_vedic["vedic_options"]["include_nakshatras"] is True
 
 
+class TestNormalizeSettings:
+    """Test normalize_settings."""
+
+    def test_normalizes_copy(self):
+        """Test that include_objects is sorted and strings are interned."""
+        import sys
+
+        settings: EphemerisSettings = {
+            "zodiac_type": "".join(["side", "real"]),
+            "ayanamsa": "lahiri",
+            "house_system": "placidus",
+            "include_objects": ["moon", "".join(["s", "un"])],
+        }
+        normalized = normalize_settings(settings)
+
+        assert normalized["include_objects"] == ("moon", "sun")
+        assert normalized["include_objects"][1] is sys.intern("sun")
+        assert normalized["zodiac_type"] is sys.intern("sidereal")
+        assert normalized["ayanamsa"] == "lahiri"
+        assert settings["include_objects"] == ["moon", "sun"]
+
+    def test_preserves_optional_fields(self):
+        """Test that None ayanamsa and vedic_options are kept."""
+        settings: EphemerisSettings = {
+            "zodiac_type": "tropical",
+            "ayanamsa": None,
+            "house_system": "placidus",
+            "include_objects": [],
+            "vedic_options": {"include_nakshatras": True},
+        }
+        normalized = normalize_settings(settings)
+
+        assert normalized["ayanamsa"] is None
+        assert normalized["include_objects"] == ()
+        assert normalized["vedic_options"] == {"include_nakshatras": True}
+
+
 class TestGeoLocation:
     """Test GeoLocation TypedDict."""
 
@@ -193,6 +234,40 @@ class TestLayerPositions:
         assert positions["houses"]["system"] == "placidus"
 
 
+class TestFreezeLayerPositions:
+    """Test freeze_layer_positions."""
+
+    def test_frozen_copy_is_equal_and_read_only(self):
+        """Test that frozen positions compare equal but reject mutation."""
+        positions: LayerPositions = {
+            "planets": {
+                "sun": {"lon": 280.5, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}
+            },
+            "houses": {
+                "system": "placidus",
+                "cusps": {"1": 15.0},
+                "angles": {"asc": 15.0, "mc": 105.0, "ic": 285.0, "dc": 195.0},
+            },
+        }
+        frozen = freeze_layer_positions(positions)
+
+        assert frozen == positions
+        assert isinstance(frozen, dict)
+        for mapping in (frozen, frozen["planets"]["sun"], frozen["houses"]["cusps"]):
+            with pytest.raises(TypeError):
+                mapping["x"] = 1.0
+            with pytest.raises(TypeError):
+                mapping.update({})
+        assert freeze_layer_positions(frozen) is frozen
+
+    def test_frozen_positions_pickle(self):
+        """Test that frozen positions survive pickling (e.g. for remote caches)."""
+        import pickle
+
+        frozen = freeze_layer_positions({"planets": {}, "houses": None})
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
 class TestLayerContext:
     """Test LayerContext TypedDict."""
 
@@ -268,3 +343,35 @@ class TestVedicOptions:
             }
             assert vedic["dashas_depth"] == depth
 
+
+class TestLabeledIntEnums:
+    """Test ZodiacType and DashaDepth."""
+
+    def test_from_label(self):
+        """Test converting settings labels to integer codes."""
+        assert ZodiacType.from_label("tropical") is ZodiacType.TROPICAL
+        assert ZodiacType.from_label("sidereal") == 1
+        assert DashaDepth.from_label("pratyantardasha") is DashaDepth.PRATYANTARDASHA
+
+    def test_label_round_trip(self):
+        """Test that every member converts back to its label."""
+        for enum in (ZodiacType, DashaDepth):
+            for member in enum:
+                assert enum.from_label(member.label) is member
+
+    def test_labels_match_literals(self):
+        """Test that labels match the Literal values in the TypedDicts."""
+        settings_hints = get_type_hints(EphemerisSettings)
+        vedic_hints = get_type_hints(VedicOptions)
+
+        assert {m.label for m in ZodiacType} == set(get_args(settings_hints["zodiac_type"]))
+        assert [m.label for m in DashaDepth] == list(get_args(vedic_hints["dashas_depth"]))
+
+    def test_dasha_depth_ordering(self):
+        """Test that deeper dasha levels compare greater."""
+        assert DashaDepth.MAHADASHA < DashaDepth.ANTARDASHA < DashaDepth.PRATYANTARDASHA
+
+    def test_unknown_label(self):
+        """Test that unknown labels raise ValueError."""
+        with pytest.raises(ValueError, match="draconic"):
+            ZodiacType.from_label("draconic")
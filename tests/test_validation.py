@@ -0,0 +1,393 @@
+"""Tests for runtime validation."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+from datetime import datetime
+
+from crius_ephemeris_core import validation
+from crius_ephemeris_core.validation import (
+    validate_ephemeris_settings,
+    validate_ephemeris_settings_json,
+    validate_geo_location,
+    validate_house_positions,
+    validate_layer_context,
+    validate_layer_context_json,
+    validate_layer_positions,
+    validate_layer_positions_json,
+    validate_planet_position,
+    validate_planet_position_into,
+    validate_planets,
+    validate_planets_json,
+)
+
+
+SETTINGS = {
+    "zodiac_type": "sidereal",
+    "ayanamsa": "lahiri",
+    "house_system": "whole_sign",
+    "include_objects": ["sun", "moon"],
+}
+
+HOUSES = {
+    "system": "placidus",
+    "cusps": {str(i): (i - 1) * 30.0 for i in range(1, 13)},
+    "angles": {"asc": 15.0, "mc": 105.0, "ic": 285.0, "dc": 195.0},
+}
+
+
+@pytest.fixture(autouse=True, params=["pydantic", "msgspec"])
+def backend(request, monkeypatch):
+    """Run every test against both validation backends."""
+    if request.param == "msgspec":
+        if not validation.MSGSPEC_AVAILABLE:
+            pytest.skip("msgspec not installed")
+    else:
+        if not validation.PYDANTIC_AVAILABLE:
+            pytest.skip("pydantic not installed")
+        pydantic_backend = validation._pydantic_backend()
+        monkeypatch.setattr(validation, "_validate", pydantic_backend.validate)
+        monkeypatch.setattr(validation, "_validate_json", pydantic_backend.validate_json)
+        monkeypatch.setattr(
+            validation,
+            "_validate_planet_position_into",
+            pydantic_backend.validate_planet_position_into,
+        )
+    return request.param
+
+
+class TestValidateEphemerisSettings:
+    """Test validate_ephemeris_settings."""
+
+    def test_valid_settings(self):
+        """Test that valid settings are returned with vedic_options filled in."""
+        assert validate_ephemeris_settings(SETTINGS) == {**SETTINGS, "vedic_options": None}
+
+    def test_vedic_options(self):
+        """Test that nested vedic options are returned as a dict."""
+        result = validate_ephemeris_settings(
+            {**SETTINGS, "vedic_options": {"include_nakshatras": True}}
+        )
+        assert result["vedic_options"]["include_nakshatras"] is True
+        assert result["vedic_options"]["enabled_vargas"] is None
+
+    def test_invalid_zodiac_type(self):
+        """Test that unknown zodiac types are rejected."""
+        with pytest.raises(ValueError):
+            validate_ephemeris_settings({**SETTINGS, "zodiac_type": "draconic"})
+
+    def test_unknown_field(self):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(ValueError):
+            validate_ephemeris_settings({**SETTINGS, "node_type": "true"})
+
+
+class TestValidateGeoLocation:
+    """Test validate_geo_location."""
+
+    def test_valid_location(self):
+        """Test that integer coordinates are normalized to floats."""
+        result = validate_geo_location({"lat": 40, "lon": -74})
+        assert result == {"lat": 40.0, "lon": -74.0}
+        assert isinstance(result["lat"], float)
+
+    @pytest.mark.parametrize(
+        "location", [{"lat": 91.0, "lon": 0.0}, {"lat": 0.0, "lon": -181.0}, {"lat": 0.0}]
+    )
+    def test_invalid_location(self, location):
+        """Test that out-of-range or missing coordinates are rejected."""
+        with pytest.raises(ValueError):
+            validate_geo_location(location)
+
+    @pytest.mark.parametrize(
+        "location",
+        [
+            {"lat": "north", "lon": 0.0},
+            {"lat": None, "lon": 0.0},
+            {"lat": float("nan"), "lon": 0.0},
+            {"lat": 10**400, "lon": 0.0},
+            {"lat": True, "lon": 0.0},
+            {"lat": 0.0, "lon": False},
+            {"lat": 0.0, "lon": 0.0, "alt": 10.0},
+        ],
+    )
+    def test_invalid_values_and_keys(self, location):
+        """Test that non-numeric, NaN, overflowing, bool and extra values are rejected."""
+        with pytest.raises(ValueError):
+            validate_geo_location(location)
+
+    def test_numeric_strings(self):
+        """Test that numeric strings are coerced like the backends do."""
+        assert validate_geo_location({"lat": "40.5", "lon": "-74"}) == {"lat": 40.5, "lon": -74.0}
+
+    def test_bypasses_backends(self, monkeypatch):
+        """Test that geo locations are validated without calling a backend."""
+
+        def fail(kind, data):
+            raise AssertionError("backend called")
+
+        monkeypatch.setattr(validation, "_validate", fail)
+        assert validate_geo_location({"lat": 0, "lon": 0}) == {"lat": 0.0, "lon": 0.0}
+
+
+class TestValidatePositions:
+    """Test planet, house and layer position validation."""
+
+    def test_planet_position(self):
+        """Test a valid planet position."""
+        position = {"lon": 280.5, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}
+        assert validate_planet_position(position) == position
+
+    def test_planet_position_returns_plain_dict(self):
+        """Test that integer input comes back as floats in a plain dict."""
+        result = validate_planet_position(
+            {"lon": 280, "lat": 0, "speed_lon": 1, "retrograde": False}
+        )
+        assert type(result) is dict
+        assert type(result["lon"]) is float
+
+    def test_planet_longitude_range(self):
+        """Test that longitudes must be in [0, 360)."""
+        with pytest.raises(ValueError):
+            validate_planet_position(
+                {"lon": 360.0, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}
+            )
+
+    def test_planet_position_into(self):
+        """Test that validated positions are written into a reused dict."""
+        out = {}
+        validate_planet_position_into(
+            out, {"lon": 280, "lat": 0, "speed_lon": 1, "retrograde": False}
+        )
+        assert out == {"lon": 280.0, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}
+        assert isinstance(out["lon"], float)
+
+        scratch = out
+        validate_planet_position_into(
+            out, {"lon": 281.0, "lat": 0.1, "speed_lon": 1.0, "retrograde": False}
+        )
+        assert out is scratch
+        assert out["lon"] == 281.0
+
+    def test_planet_position_into_invalid(self):
+        """Test that out is left unchanged when the position is invalid."""
+        out = {"lon": 1.0, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}
+        with pytest.raises(ValueError):
+            validate_planet_position_into(
+                out, {"lon": 360.0, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}
+            )
+        assert out["lon"] == 1.0
+
+    def test_house_positions(self):
+        """Test valid house positions."""
+        assert validate_house_positions(HOUSES) == HOUSES
+
+    def test_partial_angles(self):
+        """Test that angles left out by an adapter stay left out."""
+        houses = {**HOUSES, "angles": {"asc": 15.0, "mc": 105.0}}
+        assert validate_house_positions(houses) == houses
+        assert validate_house_positions({**HOUSES, "angles": {}})["angles"] == {}
+
+    def test_unknown_angle(self):
+        """Test that angles other than asc, mc, ic and dc are rejected."""
+        with pytest.raises(ValueError):
+            validate_house_positions({**HOUSES, "angles": {"asc": 15.0, "vertex": 200.0}})
+
+    def test_layer_positions(self):
+        """Test valid layer positions with and without houses."""
+        planets = {"sun": {"lon": 280.5, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}}
+        assert validate_layer_positions({"planets": planets, "houses": HOUSES}) == {
+            "planets": planets,
+            "houses": HOUSES,
+        }
+        assert validate_layer_positions({"planets": planets}) == {
+            "planets": planets,
+            "houses": None,
+        }
+
+    def test_planets(self):
+        """Test validating a planet ID -> position dict in one call."""
+        planets = {
+            "sun": {"lon": 280.5, "lat": 0.0, "speed_lon": 1.0, "retrograde": False},
+            "moon": {"lon": 10, "lat": -5, "speed_lon": 13, "retrograde": False},
+        }
+        result = validate_planets(planets)
+        assert result == planets
+        assert isinstance(result["moon"]["lon"], float)
+
+    def test_planet_ids_interned(self):
+        """Test that planet IDs built at runtime come back interned."""
+        interned = sys.intern("chiron")
+        planet_id = "".join(["chi", "ron"])
+        assert planet_id is not interned
+        position = {"lon": 10.0, "lat": 0.0, "speed_lon": 0.1, "retrograde": False}
+
+        for result in (
+            validate_planets({planet_id: position}),
+            validate_layer_positions({"planets": {planet_id: position}})["planets"],
+        ):
+            (key,) = result
+            assert key is interned
+
+    def test_invalid_planets(self):
+        """Test that one invalid planet rejects the whole dict."""
+        with pytest.raises(ValueError):
+            validate_planets(
+                {
+                    "sun": {"lon": 280.5, "lat": 0.0, "speed_lon": 1.0, "retrograde": False},
+                    "moon": {"lon": 400.0, "lat": 0.0, "speed_lon": 13.0, "retrograde": False},
+                }
+            )
+
+    def test_invalid_nested_planet(self):
+        """Test that invalid planets inside layer positions are rejected."""
+        with pytest.raises(ValueError):
+            validate_layer_positions({"planets": {"sun": {"lon": 280.5}}, "houses": None})
+
+
+class TestValidateLayerContext:
+    """Test validate_layer_context."""
+
+    def test_valid_context(self):
+        """Test that nested location and settings are validated."""
+        context = {
+            "layer_id": "natal",
+            "kind": "natal",
+            "datetime": "2024-01-01T12:00:00",
+            "location": {"lat": 40, "lon": -74},
+            "settings": SETTINGS,
+        }
+        result = validate_layer_context(context)
+
+        assert result["datetime"] == datetime(2024, 1, 1, 12, 0, 0)
+        assert result["location"] == {"lat": 40.0, "lon": -74.0}
+        assert result["settings"] == {**SETTINGS, "vedic_options": None}
+
+    def test_unknown_field(self):
+        """Test that unknown context fields are rejected."""
+        with pytest.raises(ValueError):
+            validate_layer_context(
+                {
+                    "layer_id": "natal",
+                    "kind": "natal",
+                    "datetime": datetime(2024, 1, 1),
+                    "location": None,
+                    "settings": SETTINGS,
+                    "label": "Natal chart",
+                }
+            )
+
+    def test_unknown_field_rejected_before_backend(self, monkeypatch):
+        """Test that unknown context fields fail fast without calling a backend."""
+
+        def fail(kind, data):
+            raise AssertionError("backend called")
+
+        monkeypatch.setattr(validation, "_validate", fail)
+        with pytest.raises(ValueError, match="label"):
+            validate_layer_context({"layer_id": "natal", "label": "Natal chart"})
+
+    def test_unknown_fields_listed_in_order(self):
+        """Test that unknown context fields are reported sorted."""
+        with pytest.raises(ValueError, match=r"\['color', 'label', 'notes'\]"):
+            validate_layer_context({"notes": "", "label": "", "color": "", "layer_id": "natal"})
+
+
+class TestValidateJson:
+    """Test the validate_*_json variants."""
+
+    def test_settings_json(self):
+        """Test that settings are validated and encoded as JSON bytes."""
+        result = validate_ephemeris_settings_json(SETTINGS)
+        assert isinstance(result, bytes)
+        assert json.loads(result) == {**SETTINGS, "vedic_options": None}
+
+    def test_layer_positions_json(self):
+        """Test that nested positions are encoded as JSON."""
+        planets = {"sun": {"lon": 280.5, "lat": 0.0, "speed_lon": 1.0, "retrograde": False}}
+        result = validate_layer_positions_json({"planets": planets, "houses": HOUSES})
+        assert json.loads(result) == {"planets": planets, "houses": HOUSES}
+
+    def test_layer_context_json(self):
+        """Test that the context datetime is encoded as an ISO 8601 string."""
+        context = {
+            "layer_id": "natal",
+            "kind": "natal",
+            "datetime": datetime(2024, 1, 1, 12, 0, 0),
+            "location": {"lat": 40, "lon": -74},
+            "settings": SETTINGS,
+        }
+        result = json.loads(validate_layer_context_json(context))
+
+        assert result["datetime"] == "2024-01-01T12:00:00"
+        assert result["location"] == {"lat": 40.0, "lon": -74.0}
+
+    def test_planets_json(self):
+        """Test that a planet ID -> position dict is encoded as JSON."""
+        planets = {"sun": {"lon": 280, "lat": 0, "speed_lon": 1, "retrograde": False}}
+        result = validate_planets_json(planets)
+        assert json.loads(result) == planets
+
+    def test_invalid_json_input(self):
+        """Test that invalid input is rejected before serialization."""
+        with pytest.raises(ValueError):
+            validate_ephemeris_settings_json({**SETTINGS, "zodiac_type": "draconic"})
+
+
+class TestLazyPydanticImport:
+    """Test that the Pydantic backend is only imported on first use."""
+
+    def test_import_does_not_load_pydantic(self, backend):
+        """Test that importing validation leaves pydantic unloaded."""
+        if backend != "pydantic":
+            pytest.skip("pydantic backend only")
+        code = (
+            "import sys; from crius_ephemeris_core import validation; "
+            "assert 'pydantic' not in sys.modules; "
+            "validation.GeoLocationModel; "
+            "assert 'pydantic' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_models_reexported(self, backend):
+        """Test that the Pydantic models are importable from validation."""
+        if backend != "pydantic":
+            pytest.skip("pydantic backend only")
+        from crius_ephemeris_core.validation import EphemerisSettingsModel
+        from crius_ephemeris_core import validation_pydantic
+
+        assert EphemerisSettingsModel is validation_pydantic.EphemerisSettingsModel
+
+    def test_unknown_attribute(self):
+        """Test that other missing attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            validation.NoSuchModel
+
+    def test_models_missing_without_pydantic(self, monkeypatch):
+        """Test that model access without Pydantic raises AttributeError."""
+
+        def missing():
+            raise ImportError("No module named 'pydantic'")
+
+        monkeypatch.setattr(validation, "_pydantic_backend", missing)
+        assert not hasattr(validation, "GeoLocationModel")
+        with pytest.raises(AttributeError) as excinfo:
+            validation.GeoLocationModel
+        assert isinstance(excinfo.value.__cause__, ImportError)
+
+    def test_first_call_binds_pydantic_backend(self, backend):
+        """Test that without msgspec the first call binds the Pydantic backend."""
+        if backend != "pydantic":
+            pytest.skip("pydantic backend only")
+        code = (
+            "import sys; sys.modules['msgspec'] = None; "
+            "from crius_ephemeris_core import validation; "
+            "assert not validation.MSGSPEC_AVAILABLE; "
+            "assert validation.validate_planet_position("
+            "{'lon': 1, 'lat': 0, 'speed_lon': 1, 'retrograde': False})['lon'] == 1.0; "
+            "from crius_ephemeris_core import validation_pydantic; "
+            "assert validation._validate is validation_pydantic.validate"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
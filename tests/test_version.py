@@ -19,20 +19,9 @@ class TestVersion:
         assert len(parts) == 3
         assert all(part.isdigit() for part in parts)
 
-    def test_version_matches_pyproject(self):
+    def test_version_matches_pyproject(self, pyproject_version):
         """Test that version matches pyproject.toml."""
-        # Read version from pyproject.toml manually
-        import re
-
-        with open("pyproject.toml", "r") as f:
-            content = f.read()
-            match = re.search(r'version\s*=\s*"([^"]+)"', content)
-            if match:
-                pyproject_version = match.group(1)
-                assert __version__ == pyproject_version
-            else:
-                # Fallback: just check it's a valid version
-                assert __version__ is not None
+        assert __version__ == pyproject_version
 
     def test_version_importable(self):
         """Test that version can be imported."""